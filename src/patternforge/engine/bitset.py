@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import sys
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 
 
 def make_bitset(indexes: Iterable[int]) -> int:
@@ -12,24 +12,51 @@ def make_bitset(indexes: Iterable[int]) -> int:
     return value
 
 
+# Maps 0/1 flag bytes to the ASCII digits int() parses in base 2
+_FLAG_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def from_flags(flags: bytes | bytearray) -> int:
+    """Pack one 0/1 byte per index (index 0 = least significant bit) into a bitset.
+
+    Collecting per-row match flags and packing them once avoids growing a
+    bigint with ``value |= 1 << idx`` for every set bit.
+    """
+    if not flags:
+        return 0
+    return int(flags[::-1].translate(_FLAG_DIGITS), 2)
+
+
 # Optimize bit counting based on Python version (cached at module load time)
 if sys.version_info >= (3, 10):
-    def count_bits(value: int) -> int:
-        """Count the number of set bits using native int.bit_count() (Python 3.10+)."""
-        return value.bit_count()
+    # Bind the C method directly so callers skip a Python-level wrapper frame
+    count_bits = int.bit_count
 else:
     def count_bits(value: int) -> int:
         """Count the number of set bits using bin().count('1') (Python 3.9)."""
         return bin(value).count('1')
 
 
-def iter_indexes(value: int) -> Iterable[int]:
-    index = 0
+def first_indexes(value: int, limit: int) -> list[int]:
+    """Return up to ``limit`` set-bit indexes in ascending order.
+
+    Only the set bits are visited (lowest-set-bit isolation), so pulling a few
+    examples out of a wide mask does not walk every row.
+    """
+    indexes: list[int] = []
+    while value and len(indexes) < limit:
+        low = value & -value
+        indexes.append(low.bit_length() - 1)
+        value ^= low
+    return indexes
+
+
+def iter_indexes(value: int) -> Iterator[int]:
+    """Yield set-bit indexes in ascending order, visiting only the set bits."""
     while value:
-        if value & 1:
-            yield index
-        value >>= 1
-        index += 1
+        low = value & -value
+        yield low.bit_length() - 1
+        value ^= low
 
 
 def clear_bits(base: int, remove: int) -> int:
@@ -4,7 +4,7 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Iterable, Sequence
 
-from .tokens import Token, iter_tokens
+from .tokens import Token, iter_token_values
 
 
 class CandidatePool:
@@ -43,7 +43,12 @@ def generate_candidates(
     using_custom_tokenizer = token_iter is not None
 
     if token_iter is None:
-        token_iter = iter_tokens(include, splitmethod=splitmethod, min_token_len=min_token_len)
+        # Built-in tokenizers: take each row's token values in one batch
+        for idx, values in iter_token_values(include, splitmethod, min_token_len):
+            key = (idx, None)
+            token_lists[key] = values
+            original_strings[key] = include[idx].lower()
+        token_iter = ()
     for entry in token_iter:
         if len(entry) == 2:
             idx, token = entry  # type: ignore[misc]
@@ -106,9 +111,16 @@ def generate_candidates(
                 score = len(common_prefix[:last_delim_pos]) * 2.0
                 pool.push(prefix_pattern, "prefix", apply_weight(float(score), None), None)
 
+    # Rows with the same field, text and tokens push exactly the same candidates,
+    # so repeated rows are skipped before generating anything
+    seen: set[tuple[str | None, str, tuple[str, ...]]] = set()
     for (idx_field, tokens) in token_lists.items():
         _, field = idx_field
         original_str = original_strings.get(idx_field, "")
+        row_key = (field, original_str, tuple(tokens))
+        if row_key in seen:
+            continue
+        seen.add(row_key)
 
         for token in tokens[:per_word_substrings]:
             if is_allowed("substring", field):
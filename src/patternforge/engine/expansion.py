@@ -1,9 +1,13 @@
 """Pattern expansion utilities for refining patterns to be more specific."""
 
+import re
 from typing import Optional
 from . import bitset
 from .matcher import match_pattern
 
+# Alphanumeric runs of 3+ chars; compiled once for every expansion attempt
+_WORD_RE = re.compile(r'[a-zA-Z0-9]{3,}')
+
 
 def _try_extend_multi_wildcard(pattern: str, include: list[str], exclude: list[str],
                                 current_match_bits: int, current_fp_bits: int) -> Optional[str]:
@@ -22,19 +26,19 @@ def _try_extend_multi_wildcard(pattern: str, include: list[str], exclude: list[s
         return None
 
     # Extract matching items
-    current_matches = [include[idx] for idx in range(min(len(include), 100))
-                      if (current_match_bits >> idx) & 1]
+    current_matches = [
+        include[idx]
+        for idx in bitset.iter_indexes(current_match_bits & ((1 << min(len(include), 100)) - 1))
+    ]
 
     if not current_matches:
         return None
 
     # Find common tokens that appear after the last segment in all matches
     # Tokenize each match to find potential next segments
-    import re
-
     def simple_tokenize(text: str) -> list[str]:
         """Extract tokens of 3+ alphanumeric chars"""
-        return [t.lower() for t in re.findall(r'[a-zA-Z0-9]{3,}', text)]
+        return [t.lower() for t in _WORD_RE.findall(text)]
 
     # For each match, find tokens that appear after the last segment
     last_segment = segments[-1]
@@ -171,7 +175,10 @@ def expand_pattern(pattern: str, include: list[str], exclude: list[str]) -> str:
     best_length = len(pattern.replace('*', ''))
 
     # Extract matching items from bitset for common prefix calculation
-    current_matches = [include[idx] for idx in range(min(len(include), 100)) if (current_match_bits >> idx) & 1]
+    current_matches = [
+        include[idx]
+        for idx in bitset.iter_indexes(current_match_bits & ((1 << min(len(include), 100)) - 1))
+    ]
 
     if not current_matches:
         return pattern
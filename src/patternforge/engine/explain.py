@@ -163,6 +163,14 @@ def explain_by_field(
     names = list(field_order) if field_order else [f"f{i}" for i in range(num_fields)]
     field_hits: dict[str, list[dict[str, object]]] = {name: [] for name in names}
 
+    # Column-wise field values; (field, token) hit counts are shared by all
+    # patterns that contain the same token
+    columns: list[list[str]] = [[] for _ in range(num_fields)]
+    for fields in rows_fields:
+        for fi, fv in enumerate(fields):
+            columns[fi].append(fv)
+    token_hits: dict[tuple[int, str], int] = {}
+
     patterns = solution.get("patterns", [])
     for pattern in patterns:
         text = pattern.get("text", "")
@@ -171,11 +179,12 @@ def explain_by_field(
             continue
         # Count how many tokens appear in each field across sample rows
         counts = [0] * num_fields
-        for fields in rows_fields:
-            for fi, fv in enumerate(fields):
-                for tok in tokens:
-                    if tok and tok in fv:
-                        counts[fi] += 1
+        for fi, column in enumerate(columns):
+            for tok in tokens:
+                hits = token_hits.get((fi, tok))
+                if hits is None:
+                    hits = token_hits[(fi, tok)] = sum(tok in fv for fv in column)
+                counts[fi] += hits
         if counts:
             best = max(range(len(counts)), key=lambda i: counts[i])
             fname = names[best]
@@ -1,7 +1,7 @@
 """Pattern matching primitives used by the solver."""
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from functools import lru_cache
 
 
@@ -35,38 +35,68 @@ def ordered_match(text: str, tokens: Sequence[str], start_anchor: bool, end_anch
 
 
 def match_pattern(text: str, pattern: str) -> bool:
+    """Whether ``text`` matches the glob ``pattern`` ('*' is the only wildcard).
+
+    Goes through the cached :func:`compile_glob` predicate, so repeated calls
+    with the same pattern skip re-splitting it.
+    """
+    return compile_glob(pattern)(text)
+
+
+def _match_any(text: str) -> bool:
+    return True
+
+
+@lru_cache(maxsize=4096)
+def compile_glob(pattern: str) -> Callable[[str], bool]:
+    """Return a predicate ``text -> bool`` for the glob ``pattern``.
+
+    The pattern is split once and the common shapes (exact, prefix, suffix,
+    substring) become a single string method call, so loops that test one
+    pattern against many rows skip per-call parsing.
+    """
     if pattern == "*":
-        return True
+        return _match_any
     if "*" not in pattern:
-        return text == pattern
+        return lambda text: text == pattern
     start_anchor = not pattern.startswith("*")
     end_anchor = not pattern.endswith("*")
     tokens = [chunk for chunk in pattern.split("*") if chunk]
     if not tokens:
-        return True
-    if start_anchor:
-        first = tokens[0]
-        if not text.startswith(first):
-            return False
-        start_index = len(first)
-        tokens = tokens[1:]
-    else:
-        start_index = 0
-    position = start_index
-    for idx, token in enumerate(tokens):
-        if idx == len(tokens) - 1 and end_anchor:
-            return text.endswith(token) and text.find(token, position) != -1
-        found = text.find(token, position)
-        if found == -1:
+        return _match_any
+    if len(tokens) == 1:
+        # A single literal with a '*' on at least one side
+        token = tokens[0]
+        if start_anchor:
+            return lambda text: text.startswith(token)
+        if end_anchor:
+            return lambda text: text.endswith(token)
+        return lambda text: token in text
+    head = tokens[0] if start_anchor else ""
+    middle = tokens[1:] if start_anchor else tokens
+    tail = middle[-1] if end_anchor else None
+    if end_anchor:
+        middle = middle[:-1]
+
+    def _match(text: str) -> bool:
+        if head and not text.startswith(head):
             return False
-        position = found + len(token)
-    if end_anchor and tokens:
-        return text.endswith(tokens[-1])
-    return True
+        position = len(head)
+        for token in middle:
+            found = text.find(token, position)
+            if found == -1:
+                return False
+            position = found + len(token)
+        if tail is not None:
+            # The tail must end the text without overlapping the matched prefix
+            return text.endswith(tail) and len(text) - len(tail) >= position
+        return True
+
+    return _match
 
 
 def match_all(texts: Sequence[str], pattern: str) -> list[bool]:
-    return [match_pattern(text, pattern) for text in texts]
+    return list(map(compile_glob(pattern), texts))
 
 
 @lru_cache(maxsize=4096)
@@ -74,3 +104,10 @@ def wildcard_count(pattern: str) -> int:
     leading = 1 if pattern.startswith("*") else 0
     trailing = 1 if pattern.endswith("*") else 0
     return max(pattern.count("*") - leading - trailing, 0)
+
+
+@lru_cache(maxsize=4096)
+def pattern_shape(pattern: str) -> tuple[int, int]:
+    """Return ``(wildcards, literal_length)``: the '*' count and non-'*' characters."""
+    wildcards = pattern.count("*")
+    return wildcards, len(pattern) - wildcards
@@ -2,7 +2,11 @@
 from __future__ import annotations
 
 import enum
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, replace
+
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class QualityMode(str, enum.Enum):
@@ -102,19 +106,7 @@ class SolveOptions:
     allow_complex_expressions: bool = False
 
     def for_inversion(self) -> SolveOptions:
-        return SolveOptions(
-            mode=self.mode,
-            effort=self.effort,
-            splitmethod=self.splitmethod,
-            min_token_len=self.min_token_len,
-            per_word_substrings=self.per_word_substrings,
-            max_multi_segments=self.max_multi_segments,
-            allowed_patterns=self.allowed_patterns,
-            invert=self.invert,
-            weights=self.weights,
-            budgets=self.budgets,
-            allow_complex_expressions=self.allow_complex_expressions,
-        )
+        return replace(self)
 
 
 @dataclass(frozen=True)
@@ -130,7 +122,7 @@ class Pattern:
     fp: int | None = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Candidate:
     text: str
     kind: str
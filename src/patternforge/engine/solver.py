@@ -1,17 +1,21 @@
 """Greedy solver and expression evaluator."""
 from __future__ import annotations
 
+import heapq
+import re
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import NamedTuple
 
 from . import matcher
 from . import bitset
 from .candidates import generate_candidates
 from .tokens import Token
-from .models import Pattern, Candidate, InvertStrategy, Solution, SolveOptions
+from .models import _SLOTS, Pattern, Candidate, InvertStrategy, OptimizeWeights, Solution, SolveOptions
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class _Selection:
     chosen: list[Candidate]
     include_bits: int
@@ -29,17 +33,78 @@ class _Context:
     field_getter: callable | None = None
 
 
-_DEFAULT_WEIGHTS: dict[str, float] = {
-    "w_fp": 1.0,
-    "w_fn": 1.0,
-    "w_pattern": 0.35,  # Increased from 0.05 to discourage adding redundant patterns
-    "w_op": 0.05,  # Increased from 0.02 to discourage ORing many patterns
-    "w_wc": 0.005,  # Reduced from 0.01 to be less punishing on multi-wildcard patterns
-    "w_len": -0.01,  # Negative = reward longer/more specific patterns
-}
+@dataclass(**_SLOTS)
+class _TermRow:
+    """One top-level term of a single-field solution, with its working masks.
+
+    ``fields`` is None for token-pair suggestions, which carry no field maps;
+    ``not_fields`` is only set for subtraction terms.
+    """
+
+    expr: str
+    raw_expr: str
+    matches: int
+    fp: int
+    fn: int
+    length: int
+    include_examples: list[str]
+    exclude_examples: list[str]
+    field: str | None = None
+    fields: dict[str, str] | None = None
+    not_fields: dict[str, str] | None = None
+    mask_in: int = 0
+    mask_ex: int = 0
+    incremental_matches: int = 0
+    incremental_fp: int = 0
+
+    def to_dict(self) -> dict[str, object]:
+        data: dict[str, object] = {"expr": self.expr, "raw_expr": self.raw_expr}
+        if self.fields is not None:
+            data["field"] = self.field
+            data["fields"] = self.fields
+        if self.not_fields is not None:
+            data["not_fields"] = self.not_fields
+        data.update(
+            matches=self.matches,
+            fp=self.fp,
+            fn=self.fn,
+            length=self.length,
+            include_examples=self.include_examples,
+            exclude_examples=self.exclude_examples,
+            incremental_matches=self.incremental_matches,
+            incremental_fp=self.incremental_fp,
+        )
+        return data
 
 
-def _resolve_weights(options: SolveOptions, field: str | None = None) -> dict[str, float]:
+class _Weights(NamedTuple):
+    """Resolved scalar cost weights, in cost-formula order."""
+
+    w_fp: float
+    w_fn: float
+    w_pattern: float
+    w_op: float
+    w_wc: float
+    w_len: float
+
+
+def _weights_for(weights: OptimizeWeights, field: str | None) -> _Weights:
+    from .utils import get_weight_value
+
+    return _Weights(
+        get_weight_value(weights.w_fp, field),
+        get_weight_value(weights.w_fn, field),
+        get_weight_value(weights.w_pattern, field),
+        get_weight_value(weights.w_op, field),
+        get_weight_value(weights.w_wc, field),
+        get_weight_value(weights.w_len, field),
+    )
+
+
+_weights_for_cached = lru_cache(maxsize=256)(_weights_for)
+
+
+def _resolve_weights(options: SolveOptions, field: str | None = None) -> _Weights:
     """Resolve weights for cost function, with optional per-field support.
 
     Args:
@@ -47,21 +112,17 @@ def _resolve_weights(options: SolveOptions, field: str | None = None) -> dict[st
         field: Optional field name for per-field weight resolution
 
     Returns:
-        Dict of resolved weight values for cost function
+        Resolved weight values for cost function
     """
-    from .utils import get_weight_value
-
-    weights = dict(_DEFAULT_WEIGHTS)
-    weights["w_fp"] = get_weight_value(options.weights.w_fp, field)
-    weights["w_fn"] = get_weight_value(options.weights.w_fn, field)
-    weights["w_pattern"] = get_weight_value(options.weights.w_pattern, field)
-    weights["w_op"] = get_weight_value(options.weights.w_op, field)
-    weights["w_wc"] = get_weight_value(options.weights.w_wc, field)
-    weights["w_len"] = get_weight_value(options.weights.w_len, field)
-    return weights
+    try:
+        return _weights_for_cached(options.weights, field)
+    except TypeError:
+        # Per-field dict weights make OptimizeWeights unhashable
+        return _weights_for(options.weights, field)
 
 
-def _cost(selection: _Selection, include_size: int, weights: dict[str, float]) -> float:
+def _cost(selection: _Selection, include_size: int, weights: _Weights) -> float:
+    w_fp, w_fn, w_pattern, w_op, w_wc, w_len = weights
     matched = bitset.count_bits(selection.include_bits)
     fp = bitset.count_bits(selection.exclude_bits)
     fn = include_size - matched
@@ -70,12 +131,12 @@ def _cost(selection: _Selection, include_size: int, weights: dict[str, float]) -
     length = sum(c.length for c in selection.chosen)
     ops = max(0, patterns - 1)
     return (
-        weights["w_fp"] * fp
-        + weights["w_fn"] * fn
-        + weights["w_pattern"] * patterns
-        + weights["w_op"] * ops
-        + weights["w_wc"] * wildcards
-        + weights["w_len"] * length
+        w_fp * fp
+        + w_fn * fn
+        + w_pattern * patterns
+        + w_op * ops
+        + w_wc * wildcards
+        + w_len * length
     )
 
 
@@ -93,24 +154,29 @@ def _build_candidates(ctx: _Context) -> list[Candidate]:
     candidates: list[Candidate] = []
     limit = ctx.options.budgets.max_candidates
     for pattern, kind, score, field in generated[:limit]:
-        include_bits = 0
-        exclude_bits = 0
+        include_flags = bytearray(len(ctx.include))
+        exclude_flags = bytearray(len(ctx.exclude))
+        matches = matcher.compile_glob(pattern)
         for idx, text in enumerate(ctx.include):
             if field and ctx.include_rows is not None and ctx.field_getter is not None:
                 value = str(ctx.field_getter(ctx.include_rows[idx], field))
-                matched = matcher.match_pattern(value, pattern)
+                matched = matches(value)
             else:
-                matched = matcher.match_pattern(text, pattern)
+                matched = matches(text)
             if matched:
-                include_bits |= 1 << idx
+                include_flags[idx] = 1
         for idx, text in enumerate(ctx.exclude):
             if field and ctx.exclude_rows is not None and ctx.field_getter is not None:
                 value = str(ctx.field_getter(ctx.exclude_rows[idx], field)) if idx < len(ctx.exclude_rows) else ""
-                matched = matcher.match_pattern(value, pattern)
+                matched = matches(value)
             else:
-                matched = matcher.match_pattern(text, pattern)
+                matched = matches(text)
             if matched:
-                exclude_bits |= 1 << idx
+                exclude_flags[idx] = 1
+        include_bits = bitset.from_flags(include_flags)
+        exclude_bits = bitset.from_flags(exclude_flags)
+        # Candidate texts repeat across solves, so their shape is memoized
+        wildcards, length = matcher.pattern_shape(pattern)
         candidates.append(
             Candidate(
                 text=pattern,
@@ -118,99 +184,265 @@ def _build_candidates(ctx: _Context) -> list[Candidate]:
                 score=score,
                 include_bits=include_bits,
                 exclude_bits=exclude_bits,
-                wildcards=pattern.count("*"),
-                length=len(pattern.replace("*", "")),
+                wildcards=wildcards,
+                length=length,
                 field=field,
             )
         )
     return candidates
 
 
+# Slack for float rounding when comparing the greedy lower bound to a trial cost
+_PRUNE_TOLERANCE = 1e-9
+
+
 def _greedy_select(ctx: _Context, candidates: list[Candidate]) -> _Selection:
     from .utils import resolve_budget_limit
 
     weights = _resolve_weights(ctx.options)
+    w_fp, w_fn, w_pattern, w_op, w_wc, w_len = weights
+    n_inc = len(ctx.include)
     selection = _Selection(chosen=[], include_bits=0, exclude_bits=0)
-    best_cost = _cost(selection, len(ctx.include), weights)
+    best_cost = _cost(selection, n_inc, weights)
 
     # Convert percentage budgets to absolute limits
-    max_fp = resolve_budget_limit(ctx.options.budgets.max_fp, len(ctx.include))
-    max_fn = resolve_budget_limit(ctx.options.budgets.max_fn, len(ctx.include))
-    max_patterns = resolve_budget_limit(ctx.options.budgets.max_patterns, len(ctx.include))
+    max_fp = resolve_budget_limit(ctx.options.budgets.max_fp, n_inc)
+    max_fn = resolve_budget_limit(ctx.options.budgets.max_fn, n_inc)
+    max_patterns = resolve_budget_limit(ctx.options.budgets.max_patterns, n_inc)
 
     # Safety limit to prevent infinite loops (should never be hit in practice)
     max_iterations = 100
     iteration = 0
 
+    # Running aggregates of the current selection; trials are costed from these
+    # scalars so no per-candidate list copy or _Selection is built.
+    sel_wc = 0
+    sel_len = 0
+
+    # Visit broad candidates first so a strong best candidate is found early and
+    # the lower-bound check below prunes more of the remaining scan. Equal-cost
+    # trials are resolved in generation order afterwards, so results do not
+    # depend on this order.
+    ordered = sorted(
+        range(len(candidates)), key=lambda pos: -bitset.count_bits(candidates[pos].include_bits)
+    )
+    # With a zero FP budget (always the case in EXACT mode) any candidate that
+    # hits an exclude is rejected in every round, so drop those up front and
+    # skip the FP popcount and budget check in the trial loop.
+    fp_free = max_fp == 0
+    if fp_free:
+        ordered = [pos for pos in ordered if candidates[pos].exclude_bits == 0]
+    # Structure-of-arrays view of the candidates: the trial loop reads plain
+    # ints from parallel lists instead of chasing Candidate attributes.
+    cand_pos = ordered
+    cand_in = [candidates[pos].include_bits for pos in ordered]
+    cand_ex = [candidates[pos].exclude_bits for pos in ordered]
+    cand_wc = [candidates[pos].wildcards for pos in ordered]
+    cand_len = [candidates[pos].length for pos in ordered]
+    # The bound assumes extra FP and covered includes never lower the cost
+    can_prune = w_fp >= 0 and w_fn >= 0
+
     changed = True
     while changed and iteration < max_iterations:
         iteration += 1
         changed = False
         best_candidate: Candidate | None = None
         best_candidate_cost = best_cost
-        for candidate in candidates:
-            new_include_bits = selection.include_bits | candidate.include_bits
-            new_exclude_bits = selection.exclude_bits | candidate.exclude_bits
-            trial = _Selection(
-                chosen=selection.chosen + [candidate],
-                include_bits=new_include_bits,
-                exclude_bits=new_exclude_bits,
-            )
+        # (position, coverage, wildcards, length) of every trial at the best cost
+        tied: list[tuple[int, int, int, int]] = []
+        sel_k = len(selection.chosen)
+        include_bits = selection.include_bits
+        exclude_bits = selection.exclude_bits
+        uncovered = ~include_bits
+        current_gain = bitset.count_bits(include_bits)
+        current_fp = bitset.count_bits(exclude_bits)
+        # Cost terms that do not depend on the candidate being tried
+        fixed_cost = w_pattern * (sel_k + 1) + w_op * sel_k
+        for position, c_in, c_ex, c_wc, c_len in zip(cand_pos, cand_in, cand_ex, cand_wc, cand_len):
+            new_gain = current_gain + bitset.count_bits(c_in & uncovered)
+            if can_prune:
+                # Cost if the candidate added no FP; a candidate that cannot beat
+                # the best trial so far (including one with no new coverage) is skipped.
+                lower_bound = (
+                    w_fp * current_fp
+                    + w_fn * (n_inc - new_gain)
+                    + fixed_cost
+                    + w_wc * (sel_wc + c_wc)
+                    + w_len * (sel_len + c_len)
+                )
+                if lower_bound > best_candidate_cost + _PRUNE_TOLERANCE:
+                    continue
             # Check budget constraints
-            trial_fp = bitset.count_bits(trial.exclude_bits)
-            trial_fn = len(ctx.include) - bitset.count_bits(trial.include_bits)
-            if max_fp is not None and trial_fp > max_fp:
-                continue  # Skip candidates that violate max_fp constraint
+            if fp_free:
+                trial_fp = 0
+            else:
+                # An empty exclude mask keeps the current FP; skip the OR and popcount
+                trial_fp = bitset.count_bits(exclude_bits | c_ex) if c_ex else current_fp
+                if max_fp is not None and trial_fp > max_fp:
+                    continue  # Skip candidates that violate max_fp constraint
+            trial_fn = n_inc - new_gain
             if max_fn is not None and trial_fn > max_fn:
                 continue  # Skip candidates that violate max_fn constraint
-            trial_cost = _cost(trial, len(ctx.include), weights)
-            gain = bitset.count_bits(selection.include_bits)
-            new_gain = bitset.count_bits(new_include_bits)
-            if trial_cost < best_candidate_cost or (
-                trial_cost == best_candidate_cost and (
-                    new_gain > gain
-                    or (
-                        new_gain == gain
-                        and (
-                            # tie-break by specificity: fewer wildcards, then longer length
-                            (
-                                best_candidate is None
-                                or candidate.wildcards < best_candidate.wildcards
-                                or (
-                                    candidate.wildcards == best_candidate.wildcards
-                                    and candidate.length > best_candidate.length
-                                )
-                            )
-                        )
-                    )
-                )
-            ):
+            # Summed term by term like _cost, so equal-cost ties compare exactly
+            trial_cost = (
+                w_fp * trial_fp
+                + w_fn * trial_fn
+                + w_pattern * (sel_k + 1)
+                + w_op * sel_k
+                + w_wc * (sel_wc + c_wc)
+                + w_len * (sel_len + c_len)
+            )
+            if trial_cost < best_candidate_cost:
                 best_candidate_cost = trial_cost
-                best_candidate = candidate
+                tied = [(position, new_gain, c_wc, c_len)]
+            elif trial_cost == best_candidate_cost:
+                tied.append((position, new_gain, c_wc, c_len))
+        if tied:
+            # Replay the ties in generation order: a later trial replaces the best
+            # one if it adds coverage, or else if it is more specific (fewer
+            # wildcards, then longer length).
+            tied.sort()
+            best_pos, _, best_wc, best_len = tied[0]
+            for position, new_gain, c_wc, c_len in tied[1:]:
+                if new_gain > current_gain or c_wc < best_wc or (
+                    c_wc == best_wc and c_len > best_len
+                ):
+                    best_pos, best_wc, best_len = position, c_wc, c_len
+            best_candidate = candidates[best_pos]
         within_limit = (
             max_patterns is None
             or len(selection.chosen) < max_patterns
         )
-        if best_candidate is not None and within_limit:
-            new_include_bits = selection.include_bits | best_candidate.include_bits
-            new_exclude_bits = selection.exclude_bits | best_candidate.exclude_bits
-            trial = _Selection(
+        # best_candidate_cost is the exact trial cost of best_candidate, so it is
+        # compared directly instead of re-costing a materialized selection.
+        if best_candidate is not None and within_limit and best_candidate_cost < best_cost:
+            selection = _Selection(
                 chosen=selection.chosen + [best_candidate],
-                include_bits=new_include_bits,
-                exclude_bits=new_exclude_bits,
+                include_bits=selection.include_bits | best_candidate.include_bits,
+                exclude_bits=selection.exclude_bits | best_candidate.exclude_bits,
             )
-            trial_cost = _cost(trial, len(ctx.include), weights)
-            if trial_cost < best_cost:
-                selection = trial
-                best_cost = trial_cost
-                changed = True
-
-                # Early termination: if we've covered all includes with no FP, we're done
-                if bitset.count_bits(selection.include_bits) == len(ctx.include) and bitset.count_bits(selection.exclude_bits) == 0:
-                    break
+            sel_wc += best_candidate.wildcards
+            sel_len += best_candidate.length
+            best_cost = best_candidate_cost
+            changed = True
+
+            # Early termination: if we've covered all includes with no FP, we're done
+            if bitset.count_bits(selection.include_bits) == n_inc and selection.exclude_bits == 0:
+                break
     return selection
 
 
+# Node budget for the high-effort branch-and-bound refinement of the greedy result
+_BNB_NODE_LIMIT = 20000
+
+
+def _bnb_select(ctx: _Context, candidates: list[Candidate], incumbent: _Selection) -> _Selection:
+    """Best-first branch-and-bound over candidate subsets, seeded with ``incumbent``.
+
+    Each node decides, in coverage order, whether the next candidate is taken.
+    Its lower bound assumes no further FP, that every include still reachable
+    from the remaining candidates gets covered, and that only candidates with a
+    negative fixed cost (possible with a rewarding ``w_len``) are added. Nodes
+    whose bound cannot beat the incumbent are pruned; the search stops early at
+    ``_BNB_NODE_LIMIT`` expansions and keeps the best selection found so far.
+    """
+    from .utils import resolve_budget_limit
+
+    weights = _resolve_weights(ctx.options)
+    w_fp, w_fn, w_pattern, w_op, w_wc, w_len = weights
+    n_inc = len(ctx.include)
+    if w_fp < 0 or w_fn < 0 or not n_inc:
+        return incumbent  # the bound below is only admissible for non-negative FP/FN weights
+    max_fp = resolve_budget_limit(ctx.options.budgets.max_fp, n_inc)
+    max_fn = resolve_budget_limit(ctx.options.budgets.max_fn, n_inc)
+    max_patterns = resolve_budget_limit(ctx.options.budgets.max_patterns, n_inc)
+
+    pool = [c for c in candidates if c.include_bits and (max_fp is None or bitset.count_bits(c.exclude_bits) <= max_fp)]
+    pool.sort(key=lambda c: -bitset.count_bits(c.include_bits))
+    count = len(pool)
+    # Suffix aggregates: includes still reachable, and the most negative fixed
+    # cost the remaining candidates could contribute.
+    reach = [0] * (count + 1)
+    reward = [0.0] * (count + 1)
+    for i in range(count - 1, -1, -1):
+        candidate = pool[i]
+        fixed = w_pattern + min(w_op, 0.0) + w_wc * candidate.wildcards + w_len * candidate.length
+        reach[i] = reach[i + 1] | candidate.include_bits
+        reward[i] = reward[i + 1] + min(fixed, 0.0)
+
+    def cost(inc: int, exc: int, k: int, wc: int, length: int) -> float:
+        return (
+            w_fp * bitset.count_bits(exc)
+            + w_fn * (n_inc - bitset.count_bits(inc))
+            + w_pattern * k
+            + w_op * max(0, k - 1)
+            + w_wc * wc
+            + w_len * length
+        )
+
+    def bound(i: int, inc: int, exc: int, k: int, wc: int, length: int) -> float:
+        return (
+            w_fp * bitset.count_bits(exc)
+            + w_fn * (n_inc - bitset.count_bits(inc | reach[i]))
+            + w_pattern * k
+            + w_op * max(0, k - 1)
+            + w_wc * wc
+            + w_len * length
+            + reward[i]
+        )
+
+    best_cost = _cost(incumbent, n_inc, weights)
+    best_chosen: tuple[int, ...] | None = None
+    # Heap entries: (bound, tiebreak, next index, include bits, exclude bits, k, wildcards, length, chosen)
+    heap = [(bound(0, 0, 0, 0, 0, 0), 0, 0, 0, 0, 0, 0, 0, ())]
+    pushed = 1
+    expanded = 0
+    while heap and expanded < _BNB_NODE_LIMIT:
+        lower, _, i, inc, exc, k, wc, length, chosen = heapq.heappop(heap)
+        if lower >= best_cost - _PRUNE_TOLERANCE:
+            break  # best-first: no remaining node can improve on the incumbent
+        expanded += 1
+        if i >= count:
+            continue
+        candidate = pool[i]
+        # Branch 1: take candidate i
+        new_inc = inc | candidate.include_bits
+        new_exc = exc | candidate.exclude_bits
+        new_k = k + 1
+        within = (max_patterns is None or new_k <= max_patterns) and (
+            max_fp is None or bitset.count_bits(new_exc) <= max_fp
+        )
+        if within and new_inc != inc:
+            new_wc = wc + candidate.wildcards
+            new_length = length + candidate.length
+            new_chosen = chosen + (i,)
+            trial = cost(new_inc, new_exc, new_k, new_wc, new_length)
+            if trial < best_cost - _PRUNE_TOLERANCE and (
+                max_fn is None or n_inc - bitset.count_bits(new_inc) <= max_fn
+            ):
+                best_cost = trial
+                best_chosen = new_chosen
+            child = bound(i + 1, new_inc, new_exc, new_k, new_wc, new_length)
+            if child < best_cost - _PRUNE_TOLERANCE:
+                heapq.heappush(heap, (child, pushed, i + 1, new_inc, new_exc, new_k, new_wc, new_length, new_chosen))
+                pushed += 1
+        # Branch 2: skip candidate i
+        child = bound(i + 1, inc, exc, k, wc, length)
+        if child < best_cost - _PRUNE_TOLERANCE:
+            heapq.heappush(heap, (child, pushed, i + 1, inc, exc, k, wc, length, chosen))
+            pushed += 1
+
+    if best_chosen is None:
+        return incumbent
+    chosen_candidates = [pool[i] for i in best_chosen]
+    include_bits = 0
+    exclude_bits = 0
+    for candidate in chosen_candidates:
+        include_bits |= candidate.include_bits
+        exclude_bits |= candidate.exclude_bits
+    return _Selection(chosen=chosen_candidates, include_bits=include_bits, exclude_bits=exclude_bits)
+
+
 def _patterns_from_selection(selection: _Selection) -> list[Pattern]:
     patterns: list[Pattern] = []
     for idx, candidate in enumerate(selection.chosen, start=1):
@@ -227,41 +459,103 @@ def _patterns_from_selection(selection: _Selection) -> list[Pattern]:
     return patterns
 
 
+@lru_cache(maxsize=4096)
+def _compile_expr(pattern_text: str) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Split a raw pattern into ``(left, (right, ...))`` pieces.
+
+    Supports simple conjunction '&' and difference '-' (A - B - C => A and not B
+    and not C) operators; empty pieces are dropped since they always match.
+    Conjuncts are ordered most selective first (anchored ends, then longer
+    literals) so evaluation reaches an empty mask and stops as early as possible.
+    """
+    pieces: list[tuple[str, tuple[str, ...]]] = []
+    for piece in pattern_text.split("&"):
+        piece = piece.strip()
+        if not piece:
+            continue
+        minus_parts = [p.strip().strip("()") for p in piece.split("-") if p.strip()]
+        if not minus_parts:
+            continue
+        pieces.append((minus_parts[0], tuple(minus_parts[1:])))
+    pieces.sort(key=lambda entry: (
+        entry[0].startswith("*") + entry[0].endswith("*"),
+        -(len(entry[0]) - entry[0].count("*")),
+    ))
+    return tuple(pieces)
+
+
+def _glob_mask(
+    glob: str, dataset: Sequence[str], memo: dict[str, int] | None = None, haystack: str | None = None
+) -> int:
+    """Return the dataset mask for one glob piece.
+
+    ``haystack`` is the dataset joined into one string; a glob whose longest
+    literal does not occur in it cannot match any row, so the per-row scan is
+    skipped. Occurrences spanning a row boundary only fall back to the scan.
+    """
+    if memo is not None and glob in memo:
+        return memo[glob]
+    literal = max(glob.split("*"), key=len)
+    if haystack is not None and literal and literal not in haystack:
+        mask = 0
+    else:
+        mask = bitset.from_flags(bytearray(map(matcher.compile_glob(glob), dataset)))
+    if memo is not None:
+        memo[glob] = mask
+    return mask
+
+
+def _eval_atom(
+    pattern: str, dataset: Sequence[str], memo: dict[str, int] | None = None, haystack: str | None = None
+) -> int:
+    """Return the dataset mask for one raw pattern.
+
+    ``memo`` maps glob pieces to their masks over ``dataset`` so atoms sharing
+    pieces (e.g. the same exclusion) scan the data once per call site, and
+    ``haystack`` enables the literal prefilter in :func:`_glob_mask`.
+    """
+    # Each glob piece is matched across the whole dataset with its compiled
+    # predicate, then the '&' / '-' composition is applied on the masks.
+    mask = (1 << len(dataset)) - 1
+    for left, rights in _compile_expr(pattern):
+        if not mask:
+            break
+        mask &= _glob_mask(left, dataset, memo, haystack)
+        for right in rights:
+            mask &= ~_glob_mask(right, dataset, memo, haystack)
+    return mask
+
+
 def _evaluate_patterns(
     patterns: list[Pattern], include: Sequence[str], exclude: Sequence[str]
 ) -> tuple[int, int, int, dict[str, dict[str, int]]]:
-    def _matches(text: str, pattern: str) -> bool:
-        # Support simple conjunction '&' and difference '-' (A - B) operators in raw patterns
-        def _match_piece(piece: str) -> bool:
-            piece = piece.strip()
-            if not piece:
-                return True
-            # A - B - C ... => A and not B and not C
-            minus_parts = [p.strip().strip("()") for p in piece.split("-") if p.strip()]
-            if not minus_parts:
-                return True
-            left = minus_parts[0]
-            if not matcher.match_pattern(text, left):
-                return False
-            for right in minus_parts[1:]:
-                if matcher.match_pattern(text, right):
-                    return False
-            return True
-
-        parts = [p for p in pattern.split("&")]
-        return all(_match_piece(p) for p in parts)
+    masks_in, masks_ex = _pattern_masks(patterns, include, exclude)
+    return _summarize_masks(patterns, masks_in, masks_ex, len(include))
+
+
+def _pattern_masks(
+    patterns: Sequence[Pattern], include: Sequence[str], exclude: Sequence[str]
+) -> tuple[list[int], list[int]]:
+    """Return per-pattern include/exclude match bitsets.
+
+    Glob pieces shared between patterns are matched against each dataset once.
+    """
+    include_memo: dict[str, int] = {}
+    exclude_memo: dict[str, int] = {}
+    include_text = "\n".join(include)
+    exclude_text = "\n".join(exclude)
+    masks_in = [_eval_atom(pattern.text, include, include_memo, include_text) for pattern in patterns]
+    masks_ex = [_eval_atom(pattern.text, exclude, exclude_memo, exclude_text) for pattern in patterns]
+    return masks_in, masks_ex
+
+
+def _summarize_masks(
+    patterns: Sequence[Pattern], masks_in: Sequence[int], masks_ex: Sequence[int], total_include: int
+) -> tuple[int, int, int, dict[str, dict[str, int]]]:
     include_mask = 0
     exclude_mask = 0
     per_pattern: dict[str, dict[str, int]] = {}
-    for pattern in patterns:
-        mask_in = 0
-        mask_ex = 0
-        for idx, text in enumerate(include):
-            if _matches(text, pattern.text):
-                mask_in |= 1 << idx
-        for idx, text in enumerate(exclude):
-            if _matches(text, pattern.text):
-                mask_ex |= 1 << idx
+    for pattern, mask_in, mask_ex in zip(patterns, masks_in, masks_ex):
         include_mask |= mask_in
         exclude_mask |= mask_ex
         per_pattern[pattern.id] = {
@@ -270,10 +564,14 @@ def _evaluate_patterns(
         }
     matched = bitset.count_bits(include_mask)
     fp = bitset.count_bits(exclude_mask)
-    fn = len(include) - matched
+    fn = total_include - matched
     return matched, fp, fn, per_pattern
 
 
+# Token splitter for the complex-expression suggestions in _make_solution
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]+")
+
+
 def _make_solution(
     include: Sequence[str],
     exclude: Sequence[str],
@@ -282,10 +580,18 @@ def _make_solution(
     inverted: bool,
 ) -> Solution:
     base_patterns = _patterns_from_selection(selection)
-    matched_expr, fp_expr, fn_expr, per_pattern = _evaluate_patterns(base_patterns, include, exclude)
+    # Per-pattern masks are computed once and shared by the metrics, witnesses and terms below
+    masks_in, masks_ex = _pattern_masks(base_patterns, include, exclude)
+    matched_expr, fp_expr, fn_expr, per_pattern = _summarize_masks(
+        base_patterns, masks_in, masks_ex, len(include)
+    )
     patterns: list[Pattern] = []
+    wildcards = 0
+    pattern_chars = 0
     for pattern in base_patterns:
         stats = per_pattern.get(pattern.id, {"matches": 0, "fp": 0})
+        wildcards += pattern.wildcards
+        pattern_chars += pattern.length
         patterns.append(
             Pattern(
                 id=pattern.id,
@@ -308,53 +614,29 @@ def _make_solution(
         fn = fn_expr
     expr = " | ".join(pattern.id for pattern in patterns) if patterns else "FALSE"
     raw_expr = " | ".join(pattern.text for pattern in patterns) if patterns else "FALSE"
-    def _matches(text: str, pattern: str) -> bool:
-        def _match_piece(piece: str) -> bool:
-            piece = piece.strip()
-            if not piece:
-                return True
-            minus_parts = [p.strip().strip("()") for p in piece.split("-") if p.strip()]
-            if not minus_parts:
-                return True
-            left = minus_parts[0]
-            if not matcher.match_pattern(text, left):
-                return False
-            for right in minus_parts[1:]:
-                if matcher.match_pattern(text, right):
-                    return False
-            return True
-
-        parts = [p for p in pattern.split("&")]
-        return all(_match_piece(p) for p in parts)
     witnesses = {"matches_examples": [], "fp_examples": [], "fn_examples": []}
-    dataset_pos = include
-    dataset_neg = exclude
     mask_pos = 0
     mask_neg = 0
-    for pattern in patterns:
-        for idx, text in enumerate(dataset_pos):
-            if _matches(text, pattern.text):
-                mask_pos |= 1 << idx
-        for idx, text in enumerate(dataset_neg):
-            if _matches(text, pattern.text):
-                mask_neg |= 1 << idx
-    for idx, text in enumerate(dataset_pos):
-        covered = bool(mask_pos & (1 << idx))
-        if (not inverted and covered) or (inverted and not covered):
-            witnesses["matches_examples"].append(text)
-            if len(witnesses["matches_examples"]) >= 3:
-                break
-    for idx, text in enumerate(dataset_neg):
-        covered = bool(mask_neg & (1 << idx))
-        if (not inverted and covered) or (inverted and not covered):
-            witnesses["fp_examples"].append(text)
-            if len(witnesses["fp_examples"]) >= 3:
-                break
-    for idx, text in enumerate(dataset_pos):
-        covered = bool(mask_pos & (1 << idx))
-        if (not inverted and not covered) or (inverted and covered):
-            witnesses["fn_examples"].append(text)
-            if len(witnesses["fn_examples"]) >= 3:
+    for mask_in, mask_ex in zip(masks_in, masks_ex):
+        mask_pos |= mask_in
+        mask_neg |= mask_ex
+    # One pass over the includes fills both the match and FN witness buckets
+    match_examples = witnesses["matches_examples"]
+    fn_examples = witnesses["fn_examples"]
+    for idx, text in enumerate(include):
+        # An include counts as matched when its coverage differs from `inverted`
+        if bool(mask_pos & (1 << idx)) != inverted:
+            if len(match_examples) < 3:
+                match_examples.append(text)
+        elif len(fn_examples) < 3:
+            fn_examples.append(text)
+        if len(match_examples) >= 3 and len(fn_examples) >= 3:
+            break
+    fp_examples = witnesses["fp_examples"]
+    for idx, text in enumerate(exclude):
+        if bool(mask_neg & (1 << idx)) != inverted:
+            fp_examples.append(text)
+            if len(fp_examples) >= 3:
                 break
     metrics = {
         "covered": matched,
@@ -363,25 +645,11 @@ def _make_solution(
         "fn": fn,
         "patterns": len(patterns),
         "boolean_ops": max(0, len(patterns) - 1),
-        "wildcards": sum(pattern.wildcards for pattern in patterns),
-        "pattern_chars": sum(pattern.length for pattern in patterns),
+        "wildcards": wildcards,
+        "pattern_chars": pattern_chars,
     }
     # Build top-level terms (OR of patterns, possibly conjunctions when enabled)
-    terms: list[dict[str, object]] = []
-    # Precompute per-pattern masks to enable residual stats and potential conjunctions
-    masks_in: list[int] = []
-    masks_ex: list[int] = []
-    for pattern in patterns:
-        mask_in = 0
-        mask_ex = 0
-        for idx, text in enumerate(include):
-            if _matches(text, pattern.text):
-                mask_in |= 1 << idx
-        for idx, text in enumerate(exclude):
-            if _matches(text, pattern.text):
-                mask_ex |= 1 << idx
-        masks_in.append(mask_in)
-        masks_ex.append(mask_ex)
+    terms: list[_TermRow] = []
     # When allowed, try to pair patterns into conjunction terms that retain TP and reduce FP
     used = [False] * len(patterns)
     if options.allow_complex_expressions:
@@ -391,49 +659,52 @@ def _make_solution(
             in_i = masks_in[i]
             ex_i = masks_ex[i]
             best = -1
-            best_fp = bitset.count_bits(ex_i)
+            best_fp = best_neg_fp = bitset.count_bits(ex_i)
             best_neg = -1
-            best_neg_fp = bitset.count_bits(ex_i)
             for j in range(i + 1, len(patterns)):
                 if used[j]:
                     continue
                 in_j = masks_in[j]
                 ex_j = masks_ex[j]
-                inter_in = in_i & in_j
-                inter_ex = ex_i & ex_j
-                # Only consider if preserves TP of the first while reducing FP
-                if bitset.count_bits(inter_in) == bitset.count_bits(in_i) and bitset.count_bits(inter_ex) < best_fp:
-                    best = j
-                    best_fp = bitset.count_bits(inter_ex)
-                    best_in = inter_in
-                    best_ex = inter_ex
-                # Consider subtraction A - B if B doesn't hit A's includes and reduces FP
-                diff_in = in_i & (~in_j)
-                diff_ex = ex_i & (~ex_j)
-                if bitset.count_bits(diff_in) == bitset.count_bits(in_i) and bitset.count_bits(diff_ex) < best_neg_fp:
-                    best_neg = j
-                    best_neg_fp = bitset.count_bits(diff_ex)
-                    best_neg_in = diff_in
-                    best_neg_ex = diff_ex
+                # TP preservation is a subset test on the include masks, so the
+                # FP popcount is only paid for pairs that pass it.
+                if in_i & ~in_j == 0:
+                    # A & B keeps every include of A; consider it if it reduces FP
+                    inter_ex = ex_i & ex_j
+                    inter_fp = bitset.count_bits(inter_ex)
+                    if inter_fp < best_fp:
+                        best = j
+                        best_fp = inter_fp
+                        best_in = in_i
+                        best_ex = inter_ex
+                if in_i & in_j == 0:
+                    # A - B keeps every include of A; consider it if it reduces FP
+                    diff_ex = ex_i & ~ex_j
+                    diff_fp = bitset.count_bits(diff_ex)
+                    if diff_fp < best_neg_fp:
+                        best_neg = j
+                        best_neg_fp = diff_fp
+                        best_neg_in = in_i
+                        best_neg_ex = diff_ex
             if best != -1:
                 used[i] = used[best] = True
                 a = patterns[i]
                 b = patterns[best]
                 terms.append(
-                    {
-                        "expr": f"{a.id} & {b.id}",
-                        "raw_expr": f"({a.text}) & ({b.text})",
-                        "field": a.field or b.field,
-                        "fields": {k: v for k, v in ((a.field, a.text), (b.field, b.text)) if k},
-                        "matches": bitset.count_bits(best_in),
-                        "fp": bitset.count_bits(best_ex),
-                        "fn": len(include) - bitset.count_bits(best_in),
-                        "length": a.length + b.length,
-                        "include_examples": [include[k] for k in range(len(include)) if (best_in >> k) & 1][:3],
-                        "exclude_examples": [exclude[k] for k in range(len(exclude)) if (best_ex >> k) & 1][:3],
-                        "_mask_in": best_in,
-                        "_mask_ex": best_ex,
-                    }
+                    _TermRow(
+                        expr=f"{a.id} & {b.id}",
+                        raw_expr=f"({a.text}) & ({b.text})",
+                        field=a.field or b.field,
+                        fields={k: v for k, v in ((a.field, a.text), (b.field, b.text)) if k},
+                        matches=bitset.count_bits(best_in),
+                        fp=bitset.count_bits(best_ex),
+                        fn=len(include) - bitset.count_bits(best_in),
+                        length=a.length + b.length,
+                        include_examples=[include[k] for k in bitset.first_indexes(best_in, 3)],
+                        exclude_examples=[exclude[k] for k in bitset.first_indexes(best_ex, 3)],
+                        mask_in=best_in,
+                        mask_ex=best_ex,
+                    )
                 )
             elif best_neg != -1:
                 used[i] = used[best_neg] = True
@@ -443,21 +714,21 @@ def _make_solution(
                 fields_map = ( {a.field: a.text} if a.field else {} )
                 not_fields = ( {b.field: b.text} if b.field else {} )
                 terms.append(
-                    {
-                        "expr": f"{a.id} - {b.id}",
-                        "raw_expr": f"({a.text}) - ({b.text})",
-                        "field": a.field,
-                        "fields": fields_map,
-                        "not_fields": not_fields,
-                        "matches": bitset.count_bits(best_neg_in),
-                        "fp": bitset.count_bits(best_neg_ex),
-                        "fn": len(include) - bitset.count_bits(best_neg_in),
-                        "length": a.length + b.length,
-                        "include_examples": [include[k] for k in range(len(include)) if (best_neg_in >> k) & 1][:3],
-                        "exclude_examples": [exclude[k] for k in range(len(exclude)) if (best_neg_ex >> k) & 1][:3],
-                        "_mask_in": best_neg_in,
-                        "_mask_ex": best_neg_ex,
-                    }
+                    _TermRow(
+                        expr=f"{a.id} - {b.id}",
+                        raw_expr=f"({a.text}) - ({b.text})",
+                        field=a.field,
+                        fields=fields_map,
+                        not_fields=not_fields,
+                        matches=bitset.count_bits(best_neg_in),
+                        fp=bitset.count_bits(best_neg_ex),
+                        fn=len(include) - bitset.count_bits(best_neg_in),
+                        length=a.length + b.length,
+                        include_examples=[include[k] for k in bitset.first_indexes(best_neg_in, 3)],
+                        exclude_examples=[exclude[k] for k in bitset.first_indexes(best_neg_ex, 3)],
+                        mask_in=best_neg_in,
+                        mask_ex=best_neg_ex,
+                    )
                 )
             else:
                 # fallback single expression
@@ -465,105 +736,99 @@ def _make_solution(
                 in_m = masks_in[i]
                 ex_m = masks_ex[i]
                 terms.append(
-                    {
-                        "expr": pattern.id,
-                        "raw_expr": pattern.text,
-                        "field": pattern.field,
-                        "fields": ({pattern.field: pattern.text} if pattern.field else {}),
-                        "matches": bitset.count_bits(in_m),
-                        "fp": bitset.count_bits(ex_m),
-                        "fn": len(include) - bitset.count_bits(in_m),
-                        "length": pattern.length,
-                        "include_examples": [include[k] for k in range(len(include)) if (in_m >> k) & 1][:3],
-                        "exclude_examples": [exclude[k] for k in range(len(exclude)) if (ex_m >> k) & 1][:3],
-                        "_mask_in": in_m,
-                        "_mask_ex": ex_m,
-                    }
+                    _TermRow(
+                        expr=pattern.id,
+                        raw_expr=pattern.text,
+                        field=pattern.field,
+                        fields=({pattern.field: pattern.text} if pattern.field else {}),
+                        matches=bitset.count_bits(in_m),
+                        fp=bitset.count_bits(ex_m),
+                        fn=len(include) - bitset.count_bits(in_m),
+                        length=pattern.length,
+                        include_examples=[include[k] for k in bitset.first_indexes(in_m, 3)],
+                        exclude_examples=[exclude[k] for k in bitset.first_indexes(ex_m, 3)],
+                        mask_in=in_m,
+                        mask_ex=ex_m,
+                    )
                 )
     else:
         for i, pattern in enumerate(patterns):
             in_m = masks_in[i]
             ex_m = masks_ex[i]
             terms.append(
-                {
-                    "expr": pattern.id,
-                    "raw_expr": pattern.text,
-                    "field": pattern.field,
-                    "fields": ({pattern.field: pattern.text} if pattern.field else {}),
-                    "matches": bitset.count_bits(in_m),
-                    "fp": bitset.count_bits(ex_m),
-                    "fn": len(include) - bitset.count_bits(in_m),
-                    "length": pattern.length,
-                    "include_examples": [include[k] for k in range(len(include)) if (in_m >> k) & 1][:3],
-                    "exclude_examples": [exclude[k] for k in range(len(exclude)) if (ex_m >> k) & 1][:3],
-                    "_mask_in": in_m,
-                    "_mask_ex": ex_m,
-                }
+                _TermRow(
+                    expr=pattern.id,
+                    raw_expr=pattern.text,
+                    field=pattern.field,
+                    fields=({pattern.field: pattern.text} if pattern.field else {}),
+                    matches=bitset.count_bits(in_m),
+                    fp=bitset.count_bits(ex_m),
+                    fn=len(include) - bitset.count_bits(in_m),
+                    length=pattern.length,
+                    include_examples=[include[k] for k in bitset.first_indexes(in_m, 3)],
+                    exclude_examples=[exclude[k] for k in bitset.first_indexes(ex_m, 3)],
+                    mask_in=in_m,
+                    mask_ex=ex_m,
+                )
             )
         # end base-expression assembly
 
     # Residual coverage based on greedy order of patterns
     acc_in = 0
     acc_ex = 0
-    for expression in terms:
-        term_in = expression.pop("_mask_in", 0)
-        term_ex = expression.pop("_mask_ex", 0)
-        new_in = term_in & (~acc_in)
-        new_ex = term_ex & (~acc_ex)
-        expression["incremental_matches"] = bitset.count_bits(new_in)
-        expression["incremental_fp"] = bitset.count_bits(new_ex)
-        acc_in |= term_in
-        acc_ex |= term_ex
+    for term in terms:
+        term.incremental_matches = bitset.count_bits(term.mask_in & ~acc_in)
+        term.incremental_fp = bitset.count_bits(term.mask_ex & ~acc_ex)
+        acc_in |= term.mask_in
+        acc_ex |= term.mask_ex
 
     # Enrich with simple token-based conjunction suggestions if enabled and none created
     if options.allow_complex_expressions:
-        import re
-
         def simple_tokens(s: str) -> list[str]:
-            return [t.lower() for t in re.split(r"[^A-Za-z0-9]+", s) if len(t) >= 3]
+            return [t.lower() for t in _NON_ALNUM_RE.split(s) if len(t) >= 3]
 
         tokens_in = {t for item in include for t in simple_tokens(item)}
         tokens_ex = {t for item in exclude for t in simple_tokens(item)}
         tokens = sorted(tokens_in | tokens_ex)
-        # Build masks for each token pattern *token*
-        tok_in_masks: dict[str, int] = {}
-        tok_ex_masks: dict[str, int] = {}
-        for tok in tokens[:16]:  # limit
-            pat = f"*{tok}*"
-            m_in = 0
-            m_ex = 0
-            for idx, text in enumerate(include):
-                if matcher.match_pattern(text, pat):
-                    m_in |= 1 << idx
-            for idx, text in enumerate(exclude):
-                if matcher.match_pattern(text, pat):
-                    m_ex |= 1 << idx
-            tok_in_masks[tok] = m_in
-            tok_ex_masks[tok] = m_ex
-        # Try pairs that cover many includes and reduce FP
+        # Masks for each token pattern *token*, built on first use. The tokens are
+        # non-empty, so matching *token* is a plain substring test.
+        tok_masks: dict[str, tuple[int, int]] = {}
+
+        def token_masks(tok: str) -> tuple[int, int]:
+            masks = tok_masks.get(tok)
+            if masks is None:
+                masks = (
+                    bitset.from_flags(bytearray(tok in text for text in include)),
+                    bitset.from_flags(bytearray(tok in text for text in exclude)),
+                )
+                tok_masks[tok] = masks
+            return masks
+
+        # Try pairs that cover all includes with 0 FP. Both tokens of such a pair
+        # must cover every include on their own, so only those are paired.
         added = 0
-        for i, t1 in enumerate(tokens[:16]):
-            for t2 in tokens[i + 1 : 16]:
-                inter_in = tok_in_masks[t1] & tok_in_masks[t2]
-                inter_ex = tok_ex_masks[t1] & tok_ex_masks[t2]
-                if inter_in == 0:
-                    continue
-                # prefer pairs that cover all includes and 0 FP
-                if bitset.count_bits(inter_in) == len(include) and bitset.count_bits(inter_ex) == 0:
+        full_tokens = [
+            tok for tok in tokens[:16] if include and bitset.count_bits(token_masks(tok)[0]) == len(include)
+        ]
+        for i, t1 in enumerate(full_tokens):
+            for t2 in full_tokens[i + 1 :]:
+                inter_in = token_masks(t1)[0] & token_masks(t2)[0]
+                inter_ex = token_masks(t1)[1] & token_masks(t2)[1]
+                if inter_ex == 0:
                     raw = f"(*{t1}*) & (*{t2}*)"
                     terms.append(
-                        {
-                            "expr": raw,
-                            "raw_expr": raw,
-                            "matches": bitset.count_bits(inter_in),
-                            "fp": bitset.count_bits(inter_ex),
-                            "fn": len(include) - bitset.count_bits(inter_in),
-                            "length": len(t1) + len(t2),
-                            "include_examples": [include[k] for k in range(len(include)) if (inter_in >> k) & 1][:3],
-                            "exclude_examples": [exclude[k] for k in range(len(exclude)) if (inter_ex >> k) & 1][:3],
-                            "incremental_matches": 0,
-                            "incremental_fp": 0,
-                        }
+                        _TermRow(
+                            expr=raw,
+                            raw_expr=raw,
+                            matches=bitset.count_bits(inter_in),
+                            fp=0,
+                            fn=len(include) - bitset.count_bits(inter_in),
+                            length=len(t1) + len(t2),
+                            include_examples=[include[k] for k in bitset.first_indexes(inter_in, 3)],
+                            exclude_examples=[],
+                            incremental_matches=0,
+                            incremental_fp=0,
+                        )
                     )
                     added += 1
                 if added >= 2:
@@ -573,26 +838,30 @@ def _make_solution(
         # Try subtraction pairs t1 - t2 where t2 doesn't hit includes and reduces FP
         if added < 2:
             for t1 in list(tokens_in)[:16]:
+                in_1, ex_1 = token_masks(t1)
                 for t2 in list(tokens_ex)[:16]:
                     if t1 == t2:
                         continue
-                    diff_in = tok_in_masks[t1] & (~tok_in_masks[t2])
-                    diff_ex = tok_ex_masks[t1] & (~tok_ex_masks[t2])
-                    if bitset.count_bits(diff_in) == bitset.count_bits(tok_in_masks[t1]) and bitset.count_bits(diff_ex) < bitset.count_bits(tok_ex_masks[t1]):
+                    in_2, ex_2 = token_masks(t2)
+                    if in_1 & in_2:
+                        continue
+                    diff_in = in_1
+                    diff_ex = ex_1 & ~ex_2
+                    if bitset.count_bits(diff_ex) < bitset.count_bits(ex_1):
                         raw = f"(*{t1}*) - (*{t2}*)"
                         terms.append(
-                            {
-                                "expr": raw,
-                                "raw_expr": raw,
-                                "matches": bitset.count_bits(diff_in),
-                                "fp": bitset.count_bits(diff_ex),
-                                "fn": len(include) - bitset.count_bits(diff_in),
-                                "length": len(t1) + len(t2),
-                                "include_examples": [include[k] for k in range(len(include)) if (diff_in >> k) & 1][:3],
-                                "exclude_examples": [exclude[k] for k in range(len(exclude)) if (diff_ex >> k) & 1][:3],
-                                "incremental_matches": 0,
-                                "incremental_fp": 0,
-                            }
+                            _TermRow(
+                                expr=raw,
+                                raw_expr=raw,
+                                matches=bitset.count_bits(diff_in),
+                                fp=bitset.count_bits(diff_ex),
+                                fn=len(include) - bitset.count_bits(diff_in),
+                                length=len(t1) + len(t2),
+                                include_examples=[include[k] for k in bitset.first_indexes(diff_in, 3)],
+                                exclude_examples=[exclude[k] for k in bitset.first_indexes(diff_ex, 3)],
+                                incremental_matches=0,
+                                incremental_fp=0,
+                            )
                         )
                         added += 1
                         if added >= 2:
@@ -601,16 +870,14 @@ def _make_solution(
                     break
 
     # Promote terms' field maps into final expression (OR of per-expression conjunctions)
-    def term_to_text(expression: dict[str, object], use_symbolic: bool = False) -> str:
-        fields = expression.get("fields") or {}
-        if isinstance(fields, dict) and fields:
+    def term_to_text(term: _TermRow, use_symbolic: bool = False) -> str:
+        if term.fields:
             parts = []
-            for _, pat in fields.items():
+            for _, pat in term.fields.items():
                 parts.append(f"({pat})")
             return " & ".join(parts)
         # fallback to expr (symbolic) or raw_expr (actual pattern)
-        key = "expr" if use_symbolic else "raw_expr"
-        return str(expression.get(key, "FALSE"))
+        return term.expr if use_symbolic else term.raw_expr
 
     # Generate both symbolic and raw expressions
     symbolic_expr = " | ".join(term_to_text(t, use_symbolic=True) for t in terms) if terms else "FALSE"
@@ -630,7 +897,7 @@ def _make_solution(
         patterns=patterns,
         metrics=metrics,
         witnesses=witnesses,
-        expressions=terms,
+        expressions=[term.to_dict() for term in terms],
     )
 
 
@@ -767,39 +1034,31 @@ def propose_solution(
     # Build options from kwargs
     options = _build_solve_options_from_kwargs(**kwargs) if kwargs else SolveOptions()
     # In EXACT mode, automatically enforce max_fp=0 if not already set
-    from .models import QualityMode, OptimizeBudgets
+    from .models import QualityMode
     if options.mode == QualityMode.EXACT and options.budgets.max_fp is None:
-        options = SolveOptions(
-            mode=options.mode,
-            effort=options.effort,
-            splitmethod=options.splitmethod,
-            min_token_len=options.min_token_len,
-            per_word_substrings=options.per_word_substrings,
-            max_multi_segments=options.max_multi_segments,
-            allowed_patterns=options.allowed_patterns,
-            invert=options.invert,
-            weights=options.weights,
-            budgets=OptimizeBudgets(
-                max_candidates=options.budgets.max_candidates,
-                max_patterns=options.budgets.max_patterns,
-                max_fp=0,  # Enforce zero false positives in EXACT mode
-                max_fn=options.budgets.max_fn,
-            ),
-            allow_complex_expressions=options.allow_complex_expressions,
-        )
+        # Enforce zero false positives in EXACT mode
+        options = replace(options, budgets=replace(options.budgets, max_fp=0))
     ctx = _Context(include=include, exclude=exclude, options=options, token_iter=token_iter)
     candidates = _build_candidates(ctx)
     selection = _greedy_select(ctx, candidates)
+    if options.effort in ("high", "exhaustive"):
+        # Spend the extra effort improving on the greedy selection
+        selection = _bnb_select(ctx, candidates, selection)
     base_solution = _make_solution(include, exclude, selection, options, inverted=False)
 
     # Expand patterns if w_len is negative (rewarding longer patterns) AND there are exclude items
     # (expansion without excludes tends to over-generalize to common prefix)
     weights = _resolve_weights(options)
-    if weights["w_len"] < 0 and base_solution.patterns and exclude:
+    if weights.w_len < 0 and base_solution.patterns and exclude:
         from .expansion import expand_patterns
         expanded_patterns = expand_patterns(base_solution.patterns, include, exclude)
         # Update solution with expanded patterns and recalculate metrics
         matched_expr, fp_expr, fn_expr, per_pattern = _evaluate_patterns(expanded_patterns, include, exclude)
+        wildcards = 0
+        pattern_chars = 0
+        for pattern in expanded_patterns:
+            wildcards += pattern.wildcards
+            pattern_chars += pattern.length
         base_solution = Solution(
             expr=base_solution.expr,  # Keep same expression IDs
             raw_expr=" | ".join(p.text for p in expanded_patterns) if expanded_patterns else "FALSE",
@@ -810,8 +1069,7 @@ def propose_solution(
             patterns=expanded_patterns,
             metrics={"covered": matched_expr, "total_positive": len(include), "fp": fp_expr, "fn": fn_expr,
                     "patterns": len(expanded_patterns), "boolean_ops": max(0, len(expanded_patterns) - 1),
-                    "wildcards": sum(p.wildcards for p in expanded_patterns),
-                    "pattern_chars": sum(p.length for p in expanded_patterns)},
+                    "wildcards": wildcards, "pattern_chars": pattern_chars},
             witnesses=base_solution.witnesses,
             expressions=base_solution.expressions,
         )
@@ -821,33 +1079,39 @@ def propose_solution(
     from .refinement import refine_patterns
     base_solution = refine_patterns(base_solution, include, exclude)
 
-    if options.invert == InvertStrategy.NEVER:
+    invert_strategy = options.invert
+    if invert_strategy == InvertStrategy.NEVER:
         return base_solution
-    if options.invert == InvertStrategy.ALWAYS or not base_solution.patterns:
-        inverted_solution = _make_solution(include, exclude, selection, options, inverted=True)
-        # In EXACT mode (or when max_fp is set), verify inverted solution doesn't violate FP constraint
-        if options.budgets.max_fp is not None and inverted_solution.metrics['fp'] > options.budgets.max_fp:
-            # Inverted solution violates FP constraint - return base solution instead
+    if invert_strategy != InvertStrategy.ALWAYS and base_solution.patterns:
+        # The cost comparison only needs the selection bitsets, so the universe
+        # masks are built here and the inverted solution only once it wins.
+        include_universe = (1 << len(include)) - 1
+        exclude_universe = (1 << len(exclude)) - 1 if exclude else 0
+        inverted_selection = _Selection(
+            chosen=selection.chosen,
+            include_bits=include_universe ^ selection.include_bits,
+            exclude_bits=exclude_universe ^ selection.exclude_bits,
+        )
+        base_cost = _cost(selection, len(include), weights)
+        inverted_cost = _cost(inverted_selection, len(include), weights)
+        if inverted_cost >= base_cost:
             return base_solution
-        return inverted_solution
+    # The FP budget is checked against the metrics of the built inverted solution:
+    # pattern texts may contain '&' / '-' operators, so the selection bitsets can
+    # disagree with what the returned solution reports. Fall back to the base
+    # solution if inverting breaks the FP budget.
     inverted_solution = _make_solution(include, exclude, selection, options, inverted=True)
-    weights = _resolve_weights(options)
-    base_cost = _cost(selection, len(include), weights)
-    include_universe = (1 << len(include)) - 1
-    exclude_universe = (1 << len(exclude)) - 1 if exclude else 0
-    inverted_selection = _Selection(
-        chosen=selection.chosen,
-        include_bits=include_universe ^ selection.include_bits,
-        exclude_bits=exclude_universe ^ selection.exclude_bits,
-    )
-    inverted_cost = _cost(inverted_selection, len(include), weights)
-    if options.invert == InvertStrategy.ALWAYS or inverted_cost < base_cost:
-        # In EXACT mode (or when max_fp is set), verify inverted solution doesn't violate FP constraint
-        if options.budgets.max_fp is not None and inverted_solution.metrics['fp'] > options.budgets.max_fp:
-            # Inverted solution violates FP constraint - return base solution instead
-            return base_solution
-        return inverted_solution
-    return base_solution
+    if _exceeds_fp_budget(inverted_solution.metrics["fp"], options, len(include)):
+        return base_solution
+    return inverted_solution
+
+
+def _exceeds_fp_budget(fp: int, options: SolveOptions, num_include: int) -> bool:
+    """Whether ``fp`` false positives are more than ``options`` allow."""
+    from .utils import resolve_budget_limit
+
+    max_fp = resolve_budget_limit(options.budgets.max_fp, num_include)
+    return max_fp is not None and fp > max_fp
 
 
 def _default_field_getter(row: object, field: str) -> str:
@@ -885,7 +1149,8 @@ def propose_solution_structured(
 
         fields: Field names (auto-detected from dict keys or DataFrame columns)
 
-        token_iter: [Advanced] Pre-generated token iterator (auto-generated if None)
+        token_iter: [Advanced] Accepted for compatibility; field values are tokenized
+            per distinct value by the scalable solver
 
         field_getter: [Advanced] Custom field getter function(row, field) -> str
 
@@ -923,8 +1188,6 @@ def propose_solution_structured(
         >>> options = SolveOptions(effort="low")
         >>> solution = propose_solution_structured(large_dataset, large_excludes, options=options)
     """
-    from .tokens import make_split_tokenizer, iter_structured_tokens_with_fields
-
     # Normalize input data
     def normalize_input(rows):
         if rows is None:
@@ -963,24 +1226,6 @@ def propose_solution_structured(
     # Create options from kwargs
     options = _build_solve_options_from_kwargs(**kwargs) if kwargs else SolveOptions()
 
-    # Extract per-field configuration with utils
-    from .utils import get_field_value
-
-    # Generate field tokenizers from options.splitmethod
-    if token_iter is None:
-        field_tokenizers = {}
-        for f in fields:
-            method = get_field_value(options.splitmethod, f, "classchange")
-            min_len = get_field_value(options.min_token_len, f, 3)
-            field_tokenizers[f] = make_split_tokenizer(method, min_token_len=min_len)
-
-        # Generate token iterator automatically
-        token_iter = list(iter_structured_tokens_with_fields(
-            include_rows,
-            field_tokenizers,
-            field_order=fields
-        ))
-
     # Adaptive algorithm selection based on N, F, and effort
     from .adaptive import select_algorithm, get_effort_from_string
 
@@ -1017,19 +1262,23 @@ def _propose_solution_structured_scalable(
     O(F × P × N) complexity.
     """
     from .structured_scalable import (
+        _materialize_fields,
         generate_field_patterns_scalable,
         greedy_set_cover_structured,
     )
-    from .models import Pattern, Solution
-    from . import bitset
     from .utils import resolve_budget_limit
 
+    # Field values are extracted once and shared by generation and cover
+    include_values = _materialize_fields(include_rows, field_names, field_getter)
+    exclude_values = _materialize_fields(exclude_rows, field_names, field_getter)
+
     # Generate global patterns per field
     field_patterns = generate_field_patterns_scalable(
         include_rows,
         field_names,
         field_getter,
-        max_patterns_per_field=config.get("max_patterns_per_field", 100)
+        max_patterns_per_field=config.get("max_patterns_per_field", 100),
+        include_values=include_values,
     )
 
     # Greedy set cover with lazy multi-field construction
@@ -1043,63 +1292,76 @@ def _propose_solution_structured_scalable(
         field_patterns,
         field_getter,
         max_fp=max_fp,
-        field_weights=options.weights.w_field
+        field_weights=options.weights.w_field,
+        include_values=include_values,
+        exclude_values=exclude_values,
     )
 
-    # Build solution
+    return _finalize_structured_solution(selected_expressions, include_rows, exclude_rows, options)
+
+
+def _finalize_structured_solution(
+    selected_expressions: list[dict],
+    include_rows: Sequence[dict],
+    exclude_rows: Sequence[dict],
+    options: SolveOptions,
+) -> Solution:
+    """Turn selected structured terms into a Solution (patterns, metrics, witnesses)."""
     patterns = []
-    expressions_oumatchesut = []
+    expressions_output = []
+    raw_exprs = []
+    covered_mask = 0
+    fp_mask = 0
+    wildcards = 0
+    pattern_chars = 0
 
     for expr_idx, expr_dict in enumerate(selected_expressions, 1):
         fields_dict = expr_dict["fields"]
-        expressions_oumatchesut.append({
+        include_mask = expr_dict["include_mask"]
+        exclude_mask = expr_dict["exclude_mask"]
+        covered_mask |= include_mask
+        fp_mask |= exclude_mask
+        # Built once and shared by the term's raw_expr and the top-level expression
+        conjunction = " & ".join(f"({field}: {pat})" for field, pat in fields_dict.items())
+        raw_exprs.append(f"({conjunction})")
+        matches = bitset.count_bits(include_mask)
+        expressions_output.append({
             "expr": f"E{expr_idx}",
-            "raw_expr": " & ".join(f"({field}: {pat})" for field, pat in fields_dict.items()),
+            "raw_expr": conjunction,
             "fields": fields_dict,
-            "matches": bitset.count_bits(expr_dict["include_mask"]),
-            "fp": bitset.count_bits(expr_dict["exclude_mask"]),
-            "fn": len(include_rows) - bitset.count_bits(expr_dict["include_mask"]),
+            "matches": matches,
+            "fp": bitset.count_bits(exclude_mask),
+            "fn": len(include_rows) - matches,
         })
 
         # Create patterns
         for field_name, pattern in fields_dict.items():
+            pattern_wildcards = pattern.count("*")
+            wildcards += pattern_wildcards
+            pattern_chars += len(pattern)
             patterns.append(Pattern(
                 id=f"E{expr_idx}_{field_name}",
                 text=pattern,
                 kind="structured",
-                wildcards=pattern.count("*"),
+                wildcards=pattern_wildcards,
                 length=len(pattern),
                 field=field_name,
             ))
 
-    # Compute metrics
-    covered_mask = 0
-    fp_mask = 0
-    for expr_dict in selected_expressions:
-        covered_mask |= expr_dict["include_mask"]
-        fp_mask |= expr_dict["exclude_mask"]
-
+    covered = bitset.count_bits(covered_mask)
     metrics = {
-        "covered": bitset.count_bits(covered_mask),
+        "covered": covered,
         "total_positive": len(include_rows),
         "fp": bitset.count_bits(fp_mask),
-        "fn": len(include_rows) - bitset.count_bits(covered_mask),
+        "fn": len(include_rows) - covered,
         "patterns": len(patterns),
-        "expressions": len(expressions_oumatchesut),
-        "boolean_ops": max(0, len(expressions_oumatchesut) - 1),
-        "wildcards": sum(a.wildcards for a in patterns),
-        "pattern_chars": sum(a.length for a in patterns),
+        "expressions": len(expressions_output),
+        "boolean_ops": max(0, len(expressions_output) - 1),
+        "wildcards": wildcards,
+        "pattern_chars": pattern_chars,
     }
 
-    # Build expression string
-    if expressions_oumatchesut:
-        expr_parts = []
-        for expr_dict in expressions_oumatchesut:
-            field_parts = [f"({field}: {pat})" for field, pat in expr_dict["fields"].items()]
-            expr_parts.append(" & ".join(field_parts))
-        expr_text = " | ".join(f"({part})" for part in expr_parts)
-    else:
-        expr_text = "FALSE"
+    expr_text = " | ".join(raw_exprs) or "FALSE"
 
     # Canonicalize for witnesses
     def canon(row):
@@ -1107,13 +1369,12 @@ def _propose_solution_structured_scalable(
             return "/".join(str(v) for v in row.values() if v)
         return str(row)
 
-    include_strs = [canon(r) for r in include_rows]
-    exclude_strs = [canon(r) for r in exclude_rows]
-
+    # Only the (at most 3) witness rows are canonicalized
+    fn_mask = ((1 << len(include_rows)) - 1) ^ covered_mask
     witnesses = {
-        "matches_examples": [include_strs[i] for i in range(len(include_rows)) if (covered_mask >> i) & 1][:3],
-        "fp_examples": [exclude_strs[i] for i in range(len(exclude_rows)) if (fp_mask >> i) & 1][:3],
-        "fn_examples": [include_strs[i] for i in range(len(include_rows)) if not ((covered_mask >> i) & 1)][:3],
+        "matches_examples": [canon(include_rows[i]) for i in bitset.first_indexes(covered_mask, 3)],
+        "fp_examples": [canon(exclude_rows[i]) for i in bitset.first_indexes(fp_mask, 3)],
+        "fn_examples": [canon(include_rows[i]) for i in bitset.first_indexes(fn_mask, 3)],
     }
 
     return Solution(
@@ -1130,117 +1391,104 @@ def _propose_solution_structured_scalable(
         patterns=patterns,
         metrics=metrics,
         witnesses=witnesses,
-        expressions=expressions_oumatchesut,
+        expressions=expressions_output,
     )
 
 
-def _eval_atom(pattern: str, dataset: Sequence[str]) -> int:
-    def _matches(text: str, pat: str) -> bool:
-        def _match_piece(piece: str) -> bool:
-            piece = piece.strip()
-            if not piece:
-                return True
-            minus_parts = [p.strip().strip("()") for p in piece.split("-") if p.strip()]
-            if not minus_parts:
-                return True
-            left = minus_parts[0]
-            if not matcher.match_pattern(text, left):
-                return False
-            for right in minus_parts[1:]:
-                if matcher.match_pattern(text, right):
-                    return False
-            return True
-
-        parts = [p for p in pat.split("&")]
-        return all(_match_piece(p) for p in parts)
-    mask = 0
-    for idx, item in enumerate(dataset):
-        if _matches(item, pattern):
-            mask |= 1 << idx
-    return mask
+# Expression tokens: pattern names, operators/parentheses, or any other single character
+_EXPR_TOKEN_RE = re.compile(r"\s*(?:(P\d*)|([()&|!])|(\S))")
+_BINARY_PRECEDENCE = {"|": 1, "&": 2}
+
+
+@lru_cache(maxsize=1024)
+def _compile_postfix(expr: str) -> tuple[tuple[str, str | None], ...]:
+    """Compile a boolean expression into postfix ``(op, name)`` instructions.
+
+    A single regex pass tokenizes the expression and a shunting-yard pass
+    orders it, so evaluation is a flat stack machine. ``op`` is "pattern"
+    (with the pattern name), "!", "&" or "|". Precedence is ! > & > |, with
+    binary operators left-associative.
+    """
+    output: list[tuple[str, str | None]] = []
+    stack: list[str] = []
+    expect_operand = True
+    for match in _EXPR_TOKEN_RE.finditer(expr):
+        name, op, other = match.groups()
+        if name is None and op is None and other is None:
+            break  # only trailing whitespace remained
+        if not expect_operand and (name is not None or op in ("(", "!") or other is not None):
+            raise ValueError("unexpected trailing characters")
+        if other is not None:
+            raise ValueError("expected pattern identifier")
+        if name is not None:
+            output.append(("pattern", name))
+            expect_operand = False
+        elif op in ("!", "("):
+            stack.append(op)
+        elif op == ")":
+            if expect_operand:
+                raise ValueError("expected pattern identifier")
+            while stack and stack[-1] != "(":
+                output.append((stack.pop(), None))
+            if not stack:
+                raise ValueError("unexpected trailing characters")
+            stack.pop()
+        else:
+            if expect_operand:
+                raise ValueError("expected pattern identifier")
+            precedence = _BINARY_PRECEDENCE[op]
+            while stack and stack[-1] != "(" and (
+                stack[-1] == "!" or _BINARY_PRECEDENCE[stack[-1]] >= precedence
+            ):
+                output.append((stack.pop(), None))
+            stack.append(op)
+            expect_operand = True
+    if expect_operand:
+        raise ValueError("expected pattern identifier")
+    while stack:
+        op = stack.pop()
+        if op == "(":
+            raise ValueError("missing closing parenthesis")
+        output.append((op, None))
+    return tuple(output)
 
 
 class _ExprParser:
     def __init__(self, expr: str) -> None:
         self.expr = expr
-        self.pos = 0
 
     def parse(self) -> list:
-        node = self._parse_expr()
-        self._skip_spaces()
-        if self.pos != len(self.expr):
-            raise ValueError("unexpected trailing characters")
-        return node
-
-    def _skip_spaces(self) -> None:
-        while self.pos < len(self.expr) and self.expr[self.pos].isspace():
-            self.pos += 1
-
-    def _parse_expr(self) -> list:
-        node = self._parse_term()
-        self._skip_spaces()
-        while self._peek() == "|":
-            self.pos += 1
-            rhs = self._parse_term()
-            node = ["|", node, rhs]
-            self._skip_spaces()
-        return node
-
-    def _parse_term(self) -> list:
-        node = self._parse_factor()
-        self._skip_spaces()
-        while self._peek() == "&":
-            self.pos += 1
-            rhs = self._parse_factor()
-            node = ["&", node, rhs]
-            self._skip_spaces()
-        return node
-
-    def _parse_factor(self) -> list:
-        self._skip_spaces()
-        ch = self._peek()
-        if ch == "!":
-            self.pos += 1
-            return ["!", self._parse_factor()]
-        if ch == "(":
-            self.pos += 1
-            node = self._parse_expr()
-            if self._peek() != ")":
-                raise ValueError("missing closing parenthesis")
-            self.pos += 1
-            return node
-        return ["pattern", self._parse_atom()]
-
-    def _parse_atom(self) -> str:
-        self._skip_spaces()
-        if self._peek() != "P":
-            raise ValueError("expected pattern identifier")
-        start = self.pos
-        self.pos += 1
-        while self.pos < len(self.expr) and self.expr[self.pos].isdigit():
-            self.pos += 1
-        return self.expr[start:self.pos]
-
-    def _peek(self) -> str:
-        if self.pos >= len(self.expr):
-            return ""
-        return self.expr[self.pos]
-
-
-def _eval_ast(node: list, masks: dict[str, int], universe: int) -> int:
-    op = node[0]
-    if op == "pattern":
-        name = node[1]
-        if name not in masks:
-            raise KeyError(f"missing pattern {name}")
-        return masks[name]
-    if op == "!":
-        return universe ^ _eval_ast(node[1], masks, universe)
-    if op == "&":
-        return _eval_ast(node[1], masks, universe) & _eval_ast(node[2], masks, universe)
-    if op == "|":
-        return _eval_ast(node[1], masks, universe) | _eval_ast(node[2], masks, universe)
-    raise ValueError(f"unknown op {op}")
+        """Return the expression as a nested ``[op, operand...]`` tree."""
+        stack: list[list] = []
+        for op, name in _compile_postfix(self.expr):
+            if op == "pattern":
+                stack.append(["pattern", name])
+            elif op == "!":
+                stack.append(["!", stack.pop()])
+            else:
+                rhs = stack.pop()
+                stack.append([op, stack.pop(), rhs])
+        return stack[0]
+
+
+def _eval_postfix(code: tuple[tuple[str, str | None], ...], masks: dict[str, int], universe: int) -> int:
+    stack: list[int] = []
+    for op, name in code:
+        if op == "pattern":
+            if name not in masks:
+                raise KeyError(f"missing pattern {name}")
+            stack.append(masks[name])
+        elif op == "!":
+            stack.append(universe ^ stack.pop())
+        elif op == "&":
+            rhs = stack.pop()
+            stack.append(stack.pop() & rhs)
+        elif op == "|":
+            rhs = stack.pop()
+            stack.append(stack.pop() | rhs)
+        else:
+            raise ValueError(f"unknown op {op}")
+    return stack[0]
 
 
 def evaluate_expr(
@@ -1249,14 +1497,27 @@ def evaluate_expr(
     include: Sequence[str],
     exclude: Sequence[str],
 ) -> dict[str, int]:
-    parser = _ExprParser(expr)
-    ast = parser.parse()
-    include_masks = {name: _eval_atom(pattern, include) for name, pattern in patterns.items()}
-    exclude_masks = {name: _eval_atom(pattern, exclude) for name, pattern in patterns.items()}
+    code = _compile_postfix(expr)
+    # Only patterns the expression references are evaluated; identical pattern
+    # strings and shared glob pieces are evaluated once per dataset
+    referenced = {name: patterns[name] for op, name in code if op == "pattern" and name in patterns}
+    include_memo: dict[str, int] = {}
+    exclude_memo: dict[str, int] = {}
+    include_text = "\n".join(include)
+    exclude_text = "\n".join(exclude)
+    atom_masks = {
+        pattern: (
+            _eval_atom(pattern, include, include_memo, include_text),
+            _eval_atom(pattern, exclude, exclude_memo, exclude_text),
+        )
+        for pattern in set(referenced.values())
+    }
+    include_masks = {name: atom_masks[pattern][0] for name, pattern in referenced.items()}
+    exclude_masks = {name: atom_masks[pattern][1] for name, pattern in referenced.items()}
     include_universe = (1 << len(include)) - 1
     exclude_universe = (1 << len(exclude)) - 1 if exclude else 0
-    include_mask = _eval_ast(ast, include_masks, include_universe)
-    exclude_mask = _eval_ast(ast, exclude_masks, exclude_universe)
+    include_mask = _eval_postfix(code, include_masks, include_universe)
+    exclude_mask = _eval_postfix(code, exclude_masks, exclude_universe)
     matched = bitset.count_bits(include_mask)
     fp = bitset.count_bits(exclude_mask)
     fn = len(include) - matched
@@ -4,10 +4,14 @@ Key insight: Don't enumerate all term combinations upfront. Use pattern frequenc
 and coverage-guided search to scale to O(N log N).
 """
 from __future__ import annotations
+import heapq
 from collections import defaultdict, Counter
+from functools import lru_cache
+from itertools import combinations
 from typing import Callable, Sequence
 
 from . import bitset, matcher
+from .tokens import tokenize
 
 
 class PatternStats:
@@ -19,6 +23,8 @@ class PatternStats:
         self.include_mask = 0
         self.exclude_mask = 0
         self.coverage = 0  # Number of include rows matched
+        # Compiled once; every row test reuses the same predicate
+        self._match = matcher.compile_glob(pattern)
 
     def compute_coverage(
         self,
@@ -27,16 +33,90 @@ class PatternStats:
         field_getter: Callable,
     ):
         """Compute which rows this pattern matches. O(N + M)."""
-        for idx, row in enumerate(include_rows):
-            value = field_getter(row, self.field)
-            if matcher.match_pattern(value, self.pattern):
-                self.include_mask |= (1 << idx)
-                self.coverage += 1
+        field = self.field
+        self.compute_coverage_bulk(
+            [field_getter(row, field) for row in include_rows],
+            [field_getter(row, field) for row in exclude_rows],
+        )
 
-        for idx, row in enumerate(exclude_rows):
-            value = field_getter(row, self.field)
-            if matcher.match_pattern(value, self.pattern):
-                self.exclude_mask |= (1 << idx)
+    def compute_coverage_bulk(
+        self,
+        include_values: Sequence[str],
+        exclude_values: Sequence[str],
+        include_index: dict[str, list[int]] | None = None,
+        exclude_index: dict[str, list[int]] | None = None,
+        exclude_text: str | None = None,
+    ):
+        """Compute coverage from pre-extracted field values. O(N + M).
+
+        The per-row match flags are packed into the masks in one step instead
+        of OR-ing one bit per matching row. An exact pattern (no '*') with
+        value -> row indexes from _index_values is a lookup instead of a scan.
+        ``exclude_text`` (the exclude values joined) lets a pattern whose longest
+        literal never occurs in it skip the exclude scan.
+        """
+        if include_index is not None and exclude_index is not None and "*" not in self.pattern:
+            self.include_mask = bitset.make_bitset(include_index.get(self.pattern, ()))
+            self.exclude_mask = bitset.make_bitset(exclude_index.get(self.pattern, ()))
+            self.coverage = len(include_index.get(self.pattern, ()))
+            return
+        self.include_mask = bitset.from_flags(bytearray(map(self._match, include_values)))
+        literal = max(self.pattern.split("*"), key=len)
+        if exclude_text is not None and literal and literal not in exclude_text:
+            self.exclude_mask = 0
+        else:
+            self.exclude_mask = bitset.from_flags(bytearray(map(self._match, exclude_values)))
+        self.coverage = bitset.count_bits(self.include_mask)
+
+
+def _materialize_fields(
+    rows: Sequence[dict], field_names: list[str], field_getter: Callable
+) -> dict[str, list[str]]:
+    """Extract each field's values once, as one list per field in row order."""
+    return {
+        field_name: [field_getter(row, field_name) for row in rows] for field_name in field_names
+    }
+
+
+@lru_cache(maxsize=4096)
+def _value_patterns(value: str) -> tuple[str, ...]:
+    """Candidate patterns for one field value, tokenized and rendered once.
+
+    Repeated values across fields and solves reuse the rendered tuple, which
+    keeps the order the pattern set iterates in.
+    """
+    # Tokenize once - O(len(value))
+    tokens = tokenize(value, splitmethod="classchange", min_token_len=3)
+    token_values = [token.value for token in tokens]
+
+    # Generate pattern candidates - O(P) where P is small constant
+    patterns = set()
+
+    # Exact
+    patterns.add(value.lower())
+
+    # Substrings from tokens
+    for token in token_values[:5]:
+        patterns.add(f"*{token}*")
+
+    # Prefix/suffix
+    if token_values:
+        patterns.add(f"{token_values[0]}/*")
+        patterns.add(f"*/{token_values[-1]}")
+
+    # Multi-segment (limited)
+    if len(token_values) >= 2:
+        patterns.add(f"*{token_values[0]}*{token_values[-1]}*")
+
+    return tuple(patterns)
+
+
+def _index_values(values: Sequence[str]) -> dict[str, list[int]]:
+    """Map each distinct value to the ascending row indexes holding it."""
+    index = defaultdict(list)
+    for idx, value in enumerate(values):
+        index[value].append(idx)
+    return index
 
 
 def generate_field_patterns_scalable(
@@ -44,11 +124,12 @@ def generate_field_patterns_scalable(
     field_names: list[str],
     field_getter: Callable,
     max_patterns_per_field: int = 100,
+    include_values: dict[str, list[str]] | None = None,
 ) -> dict[str, list[str]]:
     """
     Generate candidate patterns per field based on frequency.
 
-    Complexity: O(N × F × P) where P = patterns per field value
+    Complexity: O(N × F + V × P) where V = distinct field values, P = patterns per value
     Returns: O(F × P_max) patterns total
 
     Args:
@@ -56,46 +137,29 @@ def generate_field_patterns_scalable(
         field_names: List of field names
         field_getter: Function to get field value from row
         max_patterns_per_field: Max unique patterns per field
+        include_values: Field values from _materialize_fields (extracted if None)
 
     Returns:
         Dict mapping field_name -> list of patterns
     """
-    from .tokens import tokenize
+    # Group rows by field value first: structured fields repeat values heavily,
+    # so each distinct value is tokenized once and weighted by its row count.
+    if include_values is None:
+        include_values = _materialize_fields(include_rows, field_names, field_getter)
+    value_counts = {}  # field -> value -> rows
+    for field_name in field_names:
+        counts = Counter(value for value in include_values[field_name] if value)
+        if counts:
+            value_counts[field_name] = counts
 
     field_patterns = defaultdict(Counter)  # field -> pattern -> count
 
-    # Generate patterns from include rows - O(N × F × P)
-    for row in include_rows:
-        for field_name in field_names:
-            value = field_getter(row, field_name)
-            if not value:
-                continue
-
-            # Tokenize once - O(len(value))
-            tokens = tokenize(value, splitmethod="classchange", min_token_len=3)
-
-            # Generate pattern candidates - O(P) where P is small constant
-            patterns = set()
-
-            # Exact
-            patterns.add(value.lower())
-
-            # Substrings from tokens
-            for token in tokens[:5]:
-                patterns.add(f"*{token.value}*")
-
-            # Prefix/suffix
-            if tokens:
-                patterns.add(f"{tokens[0].value}/*")
-                patterns.add(f"*/{tokens[-1].value}")
-
-            # Multi-segment (limited)
-            if len(tokens) >= 2:
-                patterns.add(f"*{tokens[0].value}*{tokens[-1].value}*")
-
-            # Count pattern frequency
-            for pattern in patterns:
-                field_patterns[field_name][pattern] += 1
+    # Generate patterns from distinct include values - O(V × F × P)
+    for field_name, counts in value_counts.items():
+        for value, rows in counts.items():
+            # Count pattern frequency (one count per row holding this value)
+            for pattern in _value_patterns(value):
+                field_patterns[field_name][pattern] += rows
 
     # Select top patterns by frequency - O(F × P log P)
     result = {}
@@ -117,6 +181,8 @@ def greedy_set_cover_structured(
     field_getter: Callable,
     max_fp: int = 0,
     field_weights: dict[str, float] | None = None,
+    include_values: dict[str, list[str]] | None = None,
+    exclude_values: dict[str, list[str]] | None = None,
 ) -> list[dict]:
     """
     Greedy set cover algorithm for structured data.
@@ -134,15 +200,37 @@ def greedy_set_cover_structured(
     2. Greedily select best patterns, combining fields as needed - O(K × F × P)
     3. Construct multi-field terms lazily only when beneficial
 
+    Field values may be passed in from _materialize_fields; otherwise they
+    are extracted here. Fields without candidate patterns are skipped.
+
     Returns:
         List of term dicts with 'fields' mapping field_name -> pattern
     """
     # Step 1: Compute pattern statistics - O(F × P × N)
+    # Field values are extracted once per field and shared by all its patterns
+    if include_values is None:
+        include_values = _materialize_fields(include_rows, field_names, field_getter)
+    if exclude_values is None:
+        exclude_values = _materialize_fields(exclude_rows, field_names, field_getter)
     pattern_stats = {}  # (field, pattern) -> PatternStats
     for field_name in field_names:
-        for pattern in field_patterns[field_name]:
+        patterns = field_patterns.get(field_name, ())
+        # Exact patterns resolve through a value -> rows index built once per field
+        include_index = exclude_index = None
+        if any("*" not in pattern for pattern in patterns):
+            include_index = _index_values(include_values[field_name])
+            exclude_index = _index_values(exclude_values[field_name])
+        # Most candidate literals never occur in the exclude column at all
+        exclude_text = "\n".join(map(str, exclude_values[field_name]))
+        for pattern in patterns:
             stats = PatternStats(field_name, pattern)
-            stats.compute_coverage(include_rows, exclude_rows, field_getter)
+            stats.compute_coverage_bulk(
+                include_values[field_name],
+                exclude_values[field_name],
+                include_index,
+                exclude_index,
+                exclude_text,
+            )
             if stats.coverage > 0:  # Only keep patterns that match something
                 pattern_stats[(field_name, pattern)] = stats
 
@@ -152,80 +240,160 @@ def greedy_set_cover_structured(
     fp_mask = 0
     num_include = len(include_rows)
 
-    while bitset.count_bits(covered_mask) < num_include:
+    # Single-field candidates as parallel lists. Coverage and FP only grow, so a
+    # candidate with no new coverage or over the FP budget stays that way and is
+    # dropped for the remaining rounds (the two-field fallback still sees all).
+    active_fields = []
+    active_patterns = []
+    active_include = []
+    active_exclude = []
+    active_weights = []
+    for (field_name, pattern), stats in pattern_stats.items():
+        active_fields.append(field_name)
+        active_patterns.append(pattern)
+        active_include.append(stats.include_mask)
+        active_exclude.append(stats.exclude_mask)
+        active_weights.append(field_weights.get(field_name, 1.0) if field_weights else 1.0)
+
+    # With non-negative field weights a candidate's score only falls as rows get
+    # covered and FP accumulates, so single-field picks come from a lazy max-heap
+    # keyed (score, coverage, first slot): an entry whose recomputed key still
+    # matches its cached one beats every other entry's optimistic cached key.
+    # Negative weights make the score non-monotone and keep the full scan.
+    lazy = all(weight >= 0 for weight in active_weights)
+    heap = []
+    if lazy:
+        for slot, (include_mask, exclude_mask) in enumerate(zip(active_include, active_exclude)):
+            coverage = bitset.count_bits(include_mask)
+            score = coverage * active_weights[slot] - bitset.count_bits(exclude_mask) * 10
+            heap.append((-score, -coverage, slot))
+        heapq.heapify(heap)
+
+    # best_coverage is exactly the number of newly covered rows, so the covered
+    # count is kept incrementally instead of re-popcounting the mask each round
+    covered_count = 0
+    # Likewise best_fp is the popcount of the grown fp_mask; candidates with no
+    # exclude hits leave it unchanged and need no popcount at all
+    fp_count = 0
+    while covered_count < num_include:
         best_term = None
+        best_slot = None
         best_coverage = 0
         best_fp = float('inf')
         best_score = -1
+        uncovered = ~covered_mask
 
         # Try single-field patterns first - O(F × P)
-        for (field_name, pattern), stats in pattern_stats.items():
-            new_coverage_mask = stats.include_mask & (~covered_mask)
-            new_coverage = bitset.count_bits(new_coverage_mask)
-
-            if new_coverage == 0:
-                continue
-
-            new_fp_mask = fp_mask | stats.exclude_mask
-            new_fp = bitset.count_bits(new_fp_mask)
+        if lazy:
+            while heap:
+                cached_score, cached_coverage, slot = heap[0]
+                include_mask = active_include[slot]
+                new_coverage = bitset.count_bits(include_mask & uncovered)
+                exclude_mask = active_exclude[slot]
+                new_fp = bitset.count_bits(fp_mask | exclude_mask) if exclude_mask else fp_count
+                score = new_coverage * active_weights[slot] - new_fp * 10
+                if new_coverage == 0 or new_fp > max_fp or score < best_score:
+                    heapq.heappop(heap)  # can only get worse: drop for good
+                    continue
+                if -cached_score == score and -cached_coverage == new_coverage:
+                    heapq.heappop(heap)
+                    best_slot = slot
+                    best_coverage = new_coverage
+                    best_fp = new_fp
+                    best_score = score
+                    best_mask = include_mask
+                    best_fp_mask = exclude_mask
+                    break
+                heapq.heapreplace(heap, (-score, -new_coverage, slot))
+        else:
+            keep = []
+            for slot, include_mask in enumerate(active_include):
+                new_coverage = bitset.count_bits(include_mask & uncovered)
+
+                if new_coverage == 0:
+                    continue
 
-            if new_fp > max_fp:
-                continue
+                exclude_mask = active_exclude[slot]
+                new_fp = bitset.count_bits(fp_mask | exclude_mask) if exclude_mask else fp_count
 
-            # Score: prefer more coverage, fewer FP, apply field weight
-            weight = field_weights.get(field_name, 1.0) if field_weights else 1.0
-            score = new_coverage * weight - new_fp * 10
+                if new_fp > max_fp:
+                    continue
 
-            if score > best_score or (score == best_score and new_coverage > best_coverage):
-                best_term = {field_name: pattern}
-                best_coverage = new_coverage
-                best_fp = new_fp
-                best_score = score
-                best_mask = stats.include_mask
-                best_fp_mask = stats.exclude_mask
+                keep.append(slot)
+                # Score: prefer more coverage, fewer FP, apply field weight
+                score = new_coverage * active_weights[slot] - new_fp * 10
+
+                if score > best_score or (score == best_score and new_coverage > best_coverage):
+                    best_slot = slot
+                    best_coverage = new_coverage
+                    best_fp = new_fp
+                    best_score = score
+                    best_mask = include_mask
+                    best_fp_mask = exclude_mask
+
+        # The term dict is built once for the winner, before slots are compacted
+        if best_slot is not None:
+            best_term = {active_fields[best_slot]: active_patterns[best_slot]}
+
+        if not lazy and len(keep) < len(active_include):
+            active_fields = [active_fields[slot] for slot in keep]
+            active_patterns = [active_patterns[slot] for slot in keep]
+            active_include = [active_include[slot] for slot in keep]
+            active_exclude = [active_exclude[slot] for slot in keep]
+            active_weights = [active_weights[slot] for slot in keep]
 
         # Try two-field combinations if we have FP and can improve - O(F² × P²) per iteration
         # Only do this if max_fp is strict and we're close to limit
         if max_fp == 0 and best_term is None:
-            # Need multi-field expressions to avoid FP
-            for (field1, pat1), stats1 in pattern_stats.items():
-                new_cov1 = stats1.include_mask & (~covered_mask)
-                if bitset.count_bits(new_cov1) == 0:
-                    continue
-
+            # Need multi-field expressions to avoid FP. Only patterns that still
+            # add coverage can form a useful pair, and a pair scores the same in
+            # either order, so each unordered pair is tried once (in the order
+            # the full scan would have met it first).
+            useful = []
+            for (field_name, pattern), stats in pattern_stats.items():
+                new_cov = stats.include_mask & uncovered
+                if new_cov:
+                    weight = field_weights.get(field_name, 1.0) if field_weights else 1.0
+                    useful.append((field_name, pattern, stats, new_cov, weight))
+
+            best_pair = None
+            for first, second in combinations(useful, 2):
+                field1, pat1, stats1, new_cov1, weight1 = first
+                field2, pat2, stats2, _, weight2 = second
                 # Try adding second field to reduce FP
-                for (field2, pat2), stats2 in pattern_stats.items():
-                    if field1 == field2:
-                        continue
-
-                    # Combined mask: both patterns must match
-                    combined_include = stats1.include_mask & stats2.include_mask
-                    combined_exclude = stats1.exclude_mask & stats2.exclude_mask
+                if field1 == field2:
+                    continue
 
-                    new_coverage_mask = combined_include & (~covered_mask)
-                    new_coverage = bitset.count_bits(new_coverage_mask)
+                # Both patterns must match; the new coverage is derived from
+                # new_cov1 so no per-pair complement of covered_mask is built
+                new_coverage_mask = new_cov1 & stats2.include_mask
+                if not new_coverage_mask:
+                    continue
+                new_coverage = bitset.count_bits(new_coverage_mask)
 
-                    if new_coverage == 0:
-                        continue
+                combined_exclude = stats1.exclude_mask & stats2.exclude_mask
+                new_fp = (
+                    bitset.count_bits(fp_mask | combined_exclude) if combined_exclude else fp_count
+                )
 
-                    new_fp_mask = fp_mask | combined_exclude
-                    new_fp = bitset.count_bits(new_fp_mask)
+                if new_fp > max_fp:
+                    continue
 
-                    if new_fp > max_fp:
-                        continue
+                # Score multi-field expressions higher (more specific)
+                score = new_coverage * (weight1 + weight2) * 0.75 - new_fp * 10  # Slight penalty for complexity
 
-                    # Score multi-field expressions higher (more specific)
-                    weight1 = field_weights.get(field1, 1.0) if field_weights else 1.0
-                    weight2 = field_weights.get(field2, 1.0) if field_weights else 1.0
-                    score = new_coverage * (weight1 + weight2) * 0.75 - new_fp * 10  # Slight penalty for complexity
+                if score > best_score or (score == best_score and new_coverage > best_coverage):
+                    best_pair = (first, second)
+                    best_coverage = new_coverage
+                    best_fp = new_fp
+                    best_score = score
+                    best_fp_mask = combined_exclude
 
-                    if score > best_score or (score == best_score and new_coverage > best_coverage):
-                        best_term = {field1: pat1, field2: pat2}
-                        best_coverage = new_coverage
-                        best_fp = new_fp
-                        best_score = score
-                        best_mask = combined_include
-                        best_fp_mask = combined_exclude
+            # The winning pair's term dict and include mask are built once
+            if best_pair is not None:
+                (field1, pat1, stats1, _, _), (field2, pat2, stats2, _, _) = best_pair
+                best_term = {field1: pat1, field2: pat2}
+                best_mask = stats1.include_mask & stats2.include_mask
 
         if best_term is None:
             break  # Can't cover more without violating constraints
@@ -238,6 +406,8 @@ def greedy_set_cover_structured(
             "coverage": best_coverage,
         })
         covered_mask |= best_mask
+        covered_count += best_coverage
         fp_mask |= best_fp_mask
+        fp_count = best_fp
 
     return selected_terms
@@ -2,36 +2,57 @@
 from __future__ import annotations
 
 import re
+import sys
 from collections.abc import Iterator, Sequence
-from typing import Callable
+from functools import lru_cache
+from itertools import repeat
+from typing import Callable, NamedTuple
 
-class Token:
-    __slots__ = ("value", "index")
+class Token(NamedTuple):
+    # A tuple subclass: built without a Python-level __init__ per token
+    value: str
+    index: int
 
-    def __init__(self, value: str, index: int) -> None:
-        self.value = value
-        self.index = index
 
-    def __repr__(self) -> str:  # pragma: no cover - debug convenience
-        return f"Token({self.value!r}, {self.index})"
+# Runs of one ASCII character class; str.isalpha/isdigit agree with these on ASCII
+_ASCII_CLASSCHANGE_RE = re.compile(r"[A-Za-z]+|[0-9]+|[^A-Za-z0-9]+")
+
+
+class _CategoryTable(dict):
+    """str.translate table mapping each code point to its class letter (a/d/o).
+
+    Entries are filled on first sight, so repeated characters are classified
+    by the C-level translate instead of per-character Python calls.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        ch = chr(codepoint)
+        category = "a" if ch.isalpha() else "d" if ch.isdigit() else "o"
+        self[codepoint] = category
+        return category
+
+
+_CATEGORY_TABLE = _CategoryTable()
+_CATEGORY_RUN_RE = re.compile(r"a+|d+|o+")
 
 
 def _split_classchange(text: str) -> list[str]:
     """Split on character class changes (alpha/digit/other)."""
-    chunks: list[str] = []
-    buf = []
-    prev = None
-    for ch in text:
-        category = "alpha" if ch.isalpha() else "digit" if ch.isdigit() else "other"
-        if prev is None or category == prev:
-            buf.append(ch)
-        else:
-            chunks.append("".join(buf))
-            buf = [ch]
-        prev = category
-    if buf:
-        chunks.append("".join(buf))
-    return chunks
+    # Whole-string predicates classify every character in one C call; single-run
+    # names (module, pin and cell names) need no regex scan at all
+    if text.isalpha() or text.isdigit():
+        return [text]
+    if text.isascii():
+        return _ASCII_CLASSCHANGE_RE.findall(text)
+    # Unicode letters/digits (e.g. superscripts) need the str predicates, which
+    # the category table caches per code point; runs are then found on the
+    # translated class string and sliced out of the original text
+    categories = text.translate(_CATEGORY_TABLE)
+    return [text[run.start():run.end()] for run in _CATEGORY_RUN_RE.finditer(categories)]
+
+
+# One alphanumeric character (str.isalnum); \w is isalnum plus "_"
+_ALNUM_RE = re.compile(r"[^\W_]")
 
 
 def _merge_short_tokens(raw_tokens: list[str], min_token_len: int, joiner: str = "") -> list[tuple[str, int]]:
@@ -50,7 +71,7 @@ def _merge_short_tokens(raw_tokens: list[str], min_token_len: int, joiner: str =
 
     def is_delimiter_only(token: str) -> bool:
         """Check if token contains only delimiters (non-alphanumeric chars)."""
-        return not any(c.isalnum() for c in token)
+        return _ALNUM_RE.search(token) is None
 
     # Skip single-character alphanumeric tokens entirely as they don't carry semantic meaning
     # But keep track of delimiters to preserve them during merging
@@ -96,33 +117,81 @@ def _merge_short_tokens(raw_tokens: list[str], min_token_len: int, joiner: str =
     return merged_tokens
 
 
+def _tokenize_char(text: str, min_token_len: int = 1) -> list[Token]:
+    # Split into individual characters; they always meet the length-1 minimum
+    return [Token(ch.lower(), i) for i, ch in enumerate(text)]
+
+
+def _tokenize_classchange(text: str, min_token_len: int = 3) -> list[Token]:
+    # Split on character class changes, then merge short tokens. Merging already
+    # drops tokens shorter than min_token_len. ASCII lowercasing keeps lengths and
+    # classes, so it can run once over the whole text. Values are interned: the
+    # same module/pin names recur across rows, and the candidate dicts keyed on
+    # them then compare by identity.
+    if len(text) < min_token_len:
+        # no merged token can be longer than the text itself
+        return []
+    intern = sys.intern
+    if text.isascii():
+        merged = _merge_short_tokens(_split_classchange(text.lower()), min_token_len)
+        return [Token(intern(token), index) for token, index in merged]
+    merged = _merge_short_tokens(_split_classchange(text), min_token_len)
+    return [Token(intern(token.lower()), index) for token, index in merged]
+
+
+def _resolve_split(splitmethod: str) -> Callable[[str, int], list[Token]]:
+    """Pick the split implementation once, outside per-item loops."""
+    return _tokenize_char if splitmethod == "char" else _tokenize_classchange
+
+
 def tokenize(text: str, splitmethod: str = "classchange", min_token_len: int = 3) -> list[Token]:
-    if splitmethod == "char":
-        # Split into individual characters
-        raw_tokens = list(text)
-        effective_min_len = 1  # Characters are always length 1
-        tokens_with_indices = [(t, i) for i, t in enumerate(raw_tokens)]
-    else:  # classchange
-        # Split on character class changes, then merge short tokens
-        raw_chunks = _split_classchange(text)
-        tokens_with_indices = _merge_short_tokens(raw_chunks, min_token_len, joiner="")
-        effective_min_len = min_token_len
-
-    tokens: list[Token] = []
-    for token, index in tokens_with_indices:
-        # After merging, all tokens should meet min_token_len
-        # But we still check in case of edge cases (e.g., very short input text)
-        if len(token) >= effective_min_len:
-            tokens.append(Token(token.lower(), index))
-    return tokens
+    return _resolve_split(splitmethod)(text, min_token_len)
+
+
+# Inputs repeat heavily (shared hierarchy paths), so short strings are tokenized
+# once; long strings are mostly unique and would only churn the cache. The cache
+# is process-wide, so it is kept small like the other module-level caches.
+_CACHED_TEXT_LEN = 512
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_cached(
+    split: Callable[[str, int], list[Token]], text: str, min_token_len: int
+) -> tuple[Token, ...]:
+    return tuple(split(text, min_token_len))
+
+
+def _tokens_for(
+    split: Callable[[str, int], list[Token]], text: str, min_token_len: int
+) -> Sequence[Token]:
+    if len(text) <= _CACHED_TEXT_LEN:
+        return _tokenize_cached(split, text, min_token_len)
+    return split(text, min_token_len)
 
 
 def iter_tokens(
     items: Sequence[str], splitmethod: str, min_token_len: int
 ) -> Iterator[tuple[int, Token]]:
+    split = _resolve_split(splitmethod)
+    tokens_for = _tokens_for
+    for idx, item in enumerate(items):
+        yield from zip(repeat(idx), tokens_for(split, item, min_token_len))
+
+
+def iter_token_values(
+    items: Sequence[str], splitmethod: str, min_token_len: int
+) -> Iterator[tuple[int, list[str]]]:
+    """Yield (row_index, token values) once per item that produced any tokens.
+
+    Row-batched form of iter_tokens for consumers that only need token values:
+    one resume per row instead of one per token.
+    """
+    split = _resolve_split(splitmethod)
+    tokens_for = _tokens_for
     for idx, item in enumerate(items):
-        for token in tokenize(item, splitmethod=splitmethod, min_token_len=min_token_len):
-            yield idx, token
+        tokens = tokens_for(split, item, min_token_len)
+        if tokens:
+            yield idx, [token.value for token in tokens]
 
 
 # Advanced/custom tokenization support
@@ -130,16 +199,48 @@ Tokenizer = Callable[[str], list[Token]]
 
 
 def make_split_tokenizer(splitmethod: str = "classchange", min_token_len: int = 3) -> Tokenizer:
+    split = _resolve_split(splitmethod)
+
     def _fn(text: str) -> list[Token]:
-        return tokenize(text, splitmethod=splitmethod, min_token_len=min_token_len)
+        return list(_tokens_for(split, text, min_token_len))
 
     return _fn
 
 
 def iter_custom_tokens(items: Sequence[str], tokenizer: Tokenizer) -> Iterator[tuple[int, Token]]:
     for idx, item in enumerate(items):
-        for token in tokenizer(item):
-            yield idx, token
+        yield from zip(repeat(idx), tokenizer(item))
+
+
+def _positional_fields(
+    field_tokenizers: dict[str, Tokenizer] | Sequence[Tokenizer],
+) -> list[tuple[int, Tokenizer]]:
+    assert isinstance(field_tokenizers, Sequence)
+    return [(pos, tok) for pos, tok in enumerate(field_tokenizers) if tok is not None]
+
+
+def _ordered_fields(
+    field_tokenizers: dict[str, Tokenizer] | Sequence[Tokenizer], field_order: Sequence[str]
+) -> list[tuple[str, Tokenizer]]:
+    if not isinstance(field_tokenizers, dict):
+        return []
+    active = []
+    for name in field_order:
+        tok = field_tokenizers.get(name)
+        if tok is not None:
+            active.append((name, tok))
+    return active
+
+
+def _row_fields(
+    row: dict[str, str], field_tokenizers: dict[str, Tokenizer]
+) -> list[tuple[str, Tokenizer]]:
+    active = []
+    for name in row:
+        tok = field_tokenizers.get(name)
+        if tok is not None:
+            active.append((name, tok))
+    return active
 
 
 def iter_structured_tokens(
@@ -154,33 +255,43 @@ def iter_structured_tokens(
     - field_tokenizers: either a mapping of field name -> tokenizer (for dict rows), or
       a sequence of tokenizers in positional order (for tuple/list rows).
     - field_order: for dict rows, optional explicit field order; otherwise keys() order is used.
+
+    The active (field, tokenizer) pairs are resolved once per call (per row for
+    dict rows without field_order); each row is still dispatched on its own
+    shape, so mixed dict/positional inputs behave as before.
     """
+    make_token = Token
+    row_fields = _row_fields
+    dict_tokenizers = field_tokenizers if isinstance(field_tokenizers, dict) else None
+    ordered = _ordered_fields(field_tokenizers, field_order) if field_order else None
+    positional = None
     for idx, row in enumerate(items):
+        offset = 0
         if isinstance(row, dict):
-            names = list(field_order) if field_order else list(row.keys())
-            offset = 0
-            for name in names:
-                tok = field_tokenizers.get(name) if isinstance(field_tokenizers, dict) else None
-                if tok is None:
-                    continue
-                text = str(row.get(name, ""))
+            if dict_tokenizers is None:
+                continue
+            for name, tok in ordered if ordered is not None else row_fields(row, dict_tokenizers):
+                value = row.get(name, "")
+                text = value if isinstance(value, str) else str(value)
                 toks = tok(text)
-                for t in toks:
+                if offset:
                     # adjust index by field offset to provide stable ordering
-                    yield idx, Token(t.value, t.index + offset)
+                    toks = [make_token(t.value, t.index + offset) for t in toks]
+                # tokens are immutable tuples, so unshifted ones pass through as-is
+                yield from zip(repeat(idx), toks)
                 offset += len(text)
         else:
-            # positional sequence
-            assert isinstance(field_tokenizers, Sequence)
-            offset = 0
-            for pos, tok in enumerate(field_tokenizers):
-                if tok is None:
-                    continue
-                part = row[pos] if pos < len(row) else ""
-                toks = tok(str(part))
-                for t in toks:
-                    yield idx, Token(t.value, t.index + offset)
-                offset += len(str(part))
+            if positional is None:
+                positional = _positional_fields(field_tokenizers)
+            width = len(row)
+            for pos, tok in positional:
+                part = row[pos] if pos < width else ""
+                text = part if isinstance(part, str) else str(part)
+                toks = tok(text)
+                if offset:
+                    toks = [make_token(t.value, t.index + offset) for t in toks]
+                yield from zip(repeat(idx), toks)
+                offset += len(text)
 
 
 def iter_structured_tokens_with_fields(
@@ -192,22 +303,25 @@ def iter_structured_tokens_with_fields(
     Like iter_structured_tokens, but yields (row_index, Token, field_name) triples.
     For positional rows, field_name is f"f{index}".
     """
+    row_fields = _row_fields
+    dict_tokenizers = field_tokenizers if isinstance(field_tokenizers, dict) else None
+    ordered = _ordered_fields(field_tokenizers, field_order) if field_order else None
+    positional = None
     for idx, row in enumerate(items):
         if isinstance(row, dict):
-            names = list(field_order) if field_order else list(row.keys())
-            for name in names:
-                tok = field_tokenizers.get(name) if isinstance(field_tokenizers, dict) else None
-                if tok is None:
-                    continue
-                text = str(row.get(name, ""))
-                for t in tok(text):
-                    yield idx, t, name
+            if dict_tokenizers is None:
+                continue
+            for name, tok in ordered if ordered is not None else row_fields(row, dict_tokenizers):
+                value = row.get(name, "")
+                toks = tok(value if isinstance(value, str) else str(value))
+                yield from zip(repeat(idx), toks, repeat(name))
         else:
-            # positional sequence
-            assert isinstance(field_tokenizers, Sequence)
-            for pos, tok in enumerate(field_tokenizers):
-                if tok is None:
-                    continue
-                part = row[pos] if pos < len(row) else ""
-                for t in tok(str(part)):
-                    yield idx, t, f"f{pos}"
+            if positional is None:
+                positional = [
+                    (pos, f"f{pos}", tok) for pos, tok in _positional_fields(field_tokenizers)
+                ]
+            width = len(row)
+            for pos, name, tok in positional:
+                part = row[pos] if pos < width else ""
+                toks = tok(part if isinstance(part, str) else str(part))
+                yield from zip(repeat(idx), toks, repeat(name))
@@ -4,7 +4,7 @@ from __future__ import annotations
 import csv
 import json
 import os
-from collections.abc import Iterable
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import TextIO
 
@@ -17,27 +17,46 @@ class Items:
     exclude: list[str]
 
 
-def _read_text_lines(handle: TextIO) -> list[str]:
-    return [line.rstrip("\n\r") for line in handle if line.strip()]
+def _dumps(data) -> str:
+    # Indented encoding runs in the pure-Python encoder whose many small chunks
+    # json.dump would write one by one; render once and write a single string
+    return json.dumps(data, indent=2, sort_keys=True) + "\n"
 
 
-def _read_jsonl(handle: TextIO) -> list[str]:
-    data: list[str] = []
+def _read_text_lines(handle: TextIO, block_size: int = 1 << 20) -> Iterator[str]:
+    # Split large decoded blocks in C instead of iterating the handle line by
+    # line; universal-newline mode has already turned \r and \r\n into \n,
+    # including pairs that straddle a block boundary
+    tail = ""
+    while True:
+        block = handle.read(block_size)
+        if not block:
+            break
+        lines = (tail + block).split("\n")
+        tail = lines.pop()
+        yield from filter(str.strip, lines)
+    if tail.strip():
+        yield tail
+
+
+def _read_jsonl(handle: TextIO) -> Iterator[str]:
+    loads = json.loads
     for raw in handle:
         raw = raw.strip()
         if not raw:
             continue
-        obj = json.loads(raw)
+        obj = loads(raw)
         # For dicts, join all values; for scalars, use directly
         if isinstance(obj, dict):
-            value = "/".join(str(v) for v in obj.values() if v)
+            value = "/".join([str(v) for v in obj.values() if v])
         else:
             value = obj
-        data.append(str(value))
-    return data
+        yield str(value)
 
 
-def _read_csv(handle: TextIO, column: str | None = None, columns: list[str] | None = None) -> list[str]:
+def _read_csv(
+    handle: TextIO, column: str | None = None, columns: list[str] | None = None
+) -> Iterator[str]:
     """Read CSV file.
 
     Args:
@@ -45,70 +64,65 @@ def _read_csv(handle: TextIO, column: str | None = None, columns: list[str] | No
         column: Single column name to use (if not specified, joins all columns)
         columns: List of column names to join together (overrides column parameter)
 
-    Returns:
-        List of strings (single column values or joined multi-column values)
+    Yields:
+        Single column values or joined multi-column values, one per row
     """
-    reader = csv.DictReader(handle)
-    fieldnames = reader.fieldnames or []
+    reader = csv.reader(handle)
+    fieldnames = next(reader, [])
+    # Resolve names to positions once instead of building a dict per row;
+    # duplicate headers resolve to the last column, as csv.DictReader does
+    positions = {name: index for index, name in enumerate(fieldnames)}
 
     # If columns specified, join them together
     if columns:
-        missing = [col for col in columns if col not in fieldnames]
+        missing = [col for col in columns if col not in positions]
         if missing:
             raise ValueError(f"CSV missing specified columns: {missing}")
-
-        items: list[str] = []
-        for row in reader:
-            components: list[str] = []
-            for name in columns:
-                value = row.get(name, "")
-                if value:
-                    components.append(str(value).strip())
-            if components:
-                items.append("/".join(components))
-        return items
+        yield from _join_csv_columns(reader, [positions[name] for name in columns])
+        return
 
     # If single column specified, use that
     if column:
-        if column not in fieldnames:
+        if column not in positions:
             raise ValueError(
                 f"CSV missing column '{column}'. "
                 f"Available columns: {fieldnames}"
             )
-        return [row[column] for row in reader if row.get(column)]
+        index = positions[column]
+        for row in reader:
+            if len(row) > index and row[index]:
+                yield row[index]
+        return
 
     # Otherwise join all columns
-    items: list[str] = []
+    yield from _join_csv_columns(reader, [positions[name] for name in fieldnames])
+
+
+def _join_csv_columns(reader: Iterator[list[str]], indexes: list[int]) -> Iterator[str]:
     for row in reader:
-        components: list[str] = []
-        for name in fieldnames:
-            value = row.get(name, "")
-            if value:
-                components.append(str(value).strip())
+        width = len(row)
+        components = [row[index].strip() for index in indexes if index < width and row[index]]
         if components:
-            items.append("/".join(components))
-    return items
+            yield "/".join(components)
 
 
-def _open_path(path: str) -> Iterable[str]:
+def iter_items(path: str) -> Iterator[str]:
+    """Stream items from a text, JSON Lines or CSV file without materializing them."""
     _, ext = os.path.splitext(path)
     ext = ext.lower()
     if ext in {".json", ".jsonl"}:
         with open(path, encoding="utf-8") as handle:
-            for line in _read_jsonl(handle):
-                yield line
+            yield from _read_jsonl(handle)
     elif ext in {".csv"}:
         with open(path, encoding="utf-8", newline="") as handle:
-            for line in _read_csv(handle):
-                yield line
+            yield from _read_csv(handle)
     else:
         with open(path, encoding="utf-8") as handle:
-            for line in _read_text_lines(handle):
-                yield line
+            yield from _read_text_lines(handle)
 
 
 def read_items(path: str) -> list[str]:
-    return list(_open_path(path))
+    return list(iter_items(path))
 
 
 def load_solution(path: str) -> dict:
@@ -121,8 +135,7 @@ def save_solution(solution, path: str) -> None:
     from .engine.models import Solution
     data = solution.to_json() if isinstance(solution, Solution) else solution
     with open(path, "w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2, sort_keys=True)
-        handle.write("\n")
+        handle.write(_dumps(data))
 
 
 def write_json(obj, path: str) -> None:
@@ -130,20 +143,16 @@ def write_json(obj, path: str) -> None:
     from .engine.models import Solution
     data = obj.to_json() if isinstance(obj, Solution) else obj
     if path == "-":
-        json.dump(data, os.sys.stdout, indent=2, sort_keys=True)
-        os.sys.stdout.write("\n")
+        os.sys.stdout.write(_dumps(data))
         os.sys.stdout.flush()
         return
     with open(path, "w", encoding="utf-8") as handle:
-        json.dump(obj, handle, indent=2, sort_keys=True)
-        handle.write("\n")
+        handle.write(_dumps(data))
 
 
 def write_text(text: str, path: str) -> None:
     if path == "-":
-        os.sys.stdout.write(text)
-        if not text.endswith("\n"):
-            os.sys.stdout.write("\n")
+        os.sys.stdout.write(text if text.endswith("\n") else text + "\n")
         os.sys.stdout.flush()
         return
     with open(path, "w", encoding="utf-8") as handle:
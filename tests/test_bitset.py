@@ -21,3 +21,23 @@ def test_bitset_operations() -> None:
 
     assert bitset.and_bits(toggled, mask) == mask
     assert bitset.set_bits(0, mask) == mask
+
+
+def test_from_flags_matches_make_bitset() -> None:
+    flags = bytearray([1, 0, 1, 1, 0, 0, 0, 0, 0, 1])
+    expected = bitset.make_bitset(idx for idx, flag in enumerate(flags) if flag)
+    assert bitset.from_flags(flags) == expected
+    assert bitset.from_flags(bytearray()) == 0
+    assert bitset.from_flags(bytearray(70)) == 0
+
+
+def test_first_indexes_stops_at_limit() -> None:
+    value = bitset.make_bitset([1, 5, 64, 200])
+    assert bitset.first_indexes(value, 3) == [1, 5, 64]
+    assert bitset.first_indexes(value, 10) == [1, 5, 64, 200]
+    assert bitset.first_indexes(0, 3) == []
+
+
+def test_iter_indexes_visits_sparse_high_bits() -> None:
+    value = bitset.make_bitset([0, 64, 1000])
+    assert list(bitset.iter_indexes(value)) == [0, 64, 1000]
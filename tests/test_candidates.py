@@ -16,3 +16,15 @@ def test_generate_candidates_basic() -> None:
     patterns = [entry[0] for entry in result]
     assert any(pattern.startswith("*alpha") for pattern in patterns)
     assert any(pattern.endswith("gamma") for pattern in patterns)
+
+
+def test_generate_candidates_ignores_repeated_rows() -> None:
+    kwargs = dict(
+        splitmethod="classchange",
+        min_token_len=3,
+        per_word_substrings=8,
+        max_multi_segments=3,
+    )
+    unique = ["alpha/beta/gamma", "alpha/delta/gamma"]
+    repeated = unique + ["alpha/beta/gamma"] * 3
+    assert generate_candidates(repeated, **kwargs) == generate_candidates(unique, **kwargs)
@@ -1,11 +1,13 @@
 """Tests for complex conjunction terms when enabled."""
 from __future__ import annotations
 
+from types import MappingProxyType
+
 from patternforge.engine.solver import propose_solution
 
 
-# Complex terms options as kwargs dict
-COMPLEX_OPTIONS = {
+# Complex terms options as kwargs; read-only so no test can leak changes into another
+COMPLEX_OPTIONS = MappingProxyType({
     "mode": "EXACT",
     "invert": "never",
     "max_candidates": 256,
@@ -15,7 +17,7 @@ COMPLEX_OPTIONS = {
     "per_word_substrings": 8,
     "max_multi_segments": 3,
     "splitmethod": "classchange",
-}
+})
 
 
 def test_conjunction_term_present_and_reduces_fp() -> None:
@@ -53,3 +55,12 @@ def test_and_not_term_present_and_reduces_fp() -> None:
     minus = next(t for t in expressions if "-" in t.get("expr", "") or "-" in t.get("raw_expr", ""))
     assert minus["fp"] == 0
     assert minus["matches"] == 2
+
+
+def test_token_subtraction_handles_tokens_past_pair_limit() -> None:
+    # Exclude-only tokens sort ahead of the include tokens and fill the first 16 slots
+    include = ["zzz/yyy/mem"]
+    exclude = [f"a{i:02d}x/mem" for i in range(20)]
+    sol = propose_solution(include, exclude, **COMPLEX_OPTIONS)
+    assert sol.metrics["fn"] == 0
+    assert sol.metrics["fp"] == 0
@@ -1,7 +1,7 @@
 """Tests for custom tokenization and per-field tokenizers."""
 from __future__ import annotations
 
-import re
+import pytest
 
 from patternforge.engine.candidates import generate_candidates
 from patternforge.engine.solver import propose_solution
@@ -9,9 +9,15 @@ from patternforge.engine.tokens import (
     Token,
     iter_custom_tokens,
     iter_structured_tokens,
+    iter_structured_tokens_with_fields,
     make_split_tokenizer,
 )
 
+_FIELD_ORDER = ["module", "instance", "pin"]
+_TK = make_split_tokenizer("classchange", min_token_len=3)
+_FIELD_TOKENIZERS = {"module": _TK, "instance": _TK, "pin": _TK}
+_DELIMS_TO_DASH = str.maketrans({"_": "-", "/": "-"})
+
 
 def test_make_split_tokenizer_and_iter_custom_tokens() -> None:
     items = ["alpha-beta_gamma/123"]
@@ -31,18 +37,47 @@ def test_iter_structured_tokens_dict() -> None:
         {"module": "fabric_cache", "instance": "cache0/bank0", "pin": "data_in"},
         {"module": "fabric_cache", "instance": "cache1/bank1", "pin": "data_out"},
     ]
-    tk_module = make_split_tokenizer("classchange", min_token_len=3)
-    tk_instance = make_split_tokenizer("classchange", min_token_len=3)
-    tk_pin = make_split_tokenizer("classchange", min_token_len=3)
-    field_tokenizers = {"module": tk_module, "instance": tk_instance, "pin": tk_pin}
-    toks = list(iter_structured_tokens(rows, field_tokenizers, field_order=["module", "instance", "pin"]))
-    values_by_row: dict[int, set[str]] = {0: set(), 1: set()}
-    for idx, tok in toks:
-        values_by_row[idx].add(tok.value)
-    assert "fabric" in values_by_row[0]
-    assert "cache" in values_by_row[0]
-    assert "bank" in values_by_row[0]
-    assert "data" in values_by_row[0]
+    toks = list(iter_structured_tokens(rows, _FIELD_TOKENIZERS, field_order=_FIELD_ORDER))
+    # row -> field -> token value -> indexes, so tokens are checked against their field
+    tree: dict[int, dict[str, dict[str, list[int]]]] = {}
+    with_fields = list(
+        iter_structured_tokens_with_fields(rows, _FIELD_TOKENIZERS, field_order=_FIELD_ORDER)
+    )
+    for idx, tok, field in with_fields:
+        tree.setdefault(idx, {}).setdefault(field, {}).setdefault(tok.value, []).append(tok.index)
+    assert "fabric" in tree[0]["module"]
+    assert "cache" in tree[0]["module"]
+    assert "cache" in tree[0]["instance"]
+    assert "bank" in tree[0]["instance"]
+    assert "data" in tree[0]["pin"]
+    assert "out" in tree[1]["pin"]
+    # Both iterators walk fields in field_order; the flat one offsets indexes by
+    # the preceding fields' lengths, so they grow along each row
+    flat_values = [(idx, tok.value) for idx, tok in toks]
+    assert flat_values == [(idx, tok.value) for idx, tok, _ in with_fields]
+    for row in (0, 1):
+        indexes = [tok.index for idx, tok in toks if idx == row]
+        assert indexes == sorted(indexes)
+
+
+def test_iter_structured_tokens_mixed_row_shapes() -> None:
+    # Each row is dispatched on its own shape: dict rows need a tokenizer mapping
+    # and are skipped otherwise, positional rows need a tokenizer sequence
+    rows = [("xyz_q",), {"module": "abc"}, ("abc_def",)]
+    assert [(idx, tok.value) for idx, tok in iter_structured_tokens(rows, [_TK])] == [
+        (0, "xyz"),
+        (2, "abc"),
+        (2, "def"),
+    ]
+    with_fields = list(iter_structured_tokens_with_fields(rows, [_TK]))
+    assert [(idx, tok.value, field) for idx, tok, field in with_fields] == [
+        (0, "xyz", "f0"),
+        (2, "abc", "f0"),
+        (2, "def", "f0"),
+    ]
+    for iterator in (iter_structured_tokens, iter_structured_tokens_with_fields):
+        with pytest.raises(AssertionError):
+            list(iterator([{"module": "abc"}, ("xyz_q",)], _FIELD_TOKENIZERS))
 
 
 def test_generate_candidates_with_custom_iter() -> None:
@@ -82,12 +117,8 @@ def test_propose_solution_with_structured_tokenizer_finds_bank() -> None:
     include = [canon(r) for r in include_rows]
     exclude = [canon(r) for r in exclude_rows]
 
-    tk_module = make_split_tokenizer("classchange", min_token_len=3)
-    tk_instance = make_split_tokenizer("classchange", min_token_len=3)
-    tk_pin = make_split_tokenizer("classchange", min_token_len=3)
-    field_tokenizers = {"module": tk_module, "instance": tk_instance, "pin": tk_pin}
     token_iter = list(
-        iter_structured_tokens(include_rows, field_tokenizers, field_order=["module", "instance", "pin"])  # noqa: E501
+        iter_structured_tokens(include_rows, _FIELD_TOKENIZERS, field_order=_FIELD_ORDER)
     )
 
     solution = propose_solution(include, exclude, token_iter, mode="APPROX")
@@ -103,7 +134,7 @@ def test_propose_solution_custom_iter_overrides_min_token_len() -> None:
 
     # With min_token_len very high, default tokenization would produce no tokens; supply our own
     def my_tok(s: str) -> list[Token]:
-        parts = [p for p in re.split(r"[-_/]", s.lower()) if p]
+        parts = [p for p in s.lower().translate(_DELIMS_TO_DASH).split("-") if p]
         return [Token(p, i) for i, p in enumerate(parts)]
 
     token_iter = list(iter_custom_tokens(include, my_tok))
@@ -19,6 +19,14 @@ def test_read_text_and_jsonl(tmp_path: Path) -> None:
     assert io.read_items(str(jsonl_path)) == ["gamma", "delta"]
 
 
+def test_iter_items_streams_lines(tmp_path: Path) -> None:
+    text_path = tmp_path / "items.txt"
+    text_path.write_text("alpha\n\n  \nbeta\r\n")
+    stream = io.iter_items(str(text_path))
+    assert next(stream) == "alpha"
+    assert list(stream) == ["beta"]
+
+
 def test_read_csv(tmp_path: Path) -> None:
     csv_path = tmp_path / "items.csv"
     csv_path.write_text("item\nalpha\nbeta\n")
@@ -40,6 +48,12 @@ def test_read_csv_composite_columns(tmp_path: Path) -> None:
     ]
 
 
+def test_read_jsonl_accepts_stdlib_json_extensions(tmp_path: Path) -> None:
+    jsonl_path = tmp_path / "items.jsonl"
+    jsonl_path.write_text('{"id": 123456789012345678901234567890}\n"mod\u00fcle"\nNaN\n')
+    assert io.read_items(str(jsonl_path)) == ["123456789012345678901234567890", "modüle", "nan"]
+
+
 def test_load_and_save_solution(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
     path = tmp_path / "solution.json"
     payload = {"expr": "P1", "patterns": []}
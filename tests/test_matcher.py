@@ -1,8 +1,17 @@
 """Tests for pattern matching helpers."""
 
+from fnmatch import fnmatchcase
+
 import pytest
 
-from patternforge.engine.matcher import match_all, match_pattern, ordered_match, wildcard_count
+from patternforge.engine.matcher import (
+    compile_glob,
+    match_all,
+    match_pattern,
+    ordered_match,
+    pattern_shape,
+    wildcard_count,
+)
 
 
 @pytest.mark.parametrize(
@@ -31,3 +40,36 @@ def test_match_all_and_wildcard_count() -> None:
     flags = match_all(texts, "a*c")
     assert flags == [True, False, True]
     assert wildcard_count("*abc*") == 0
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "*",
+        "**",
+        "abc",
+        "",
+        "abc*",
+        "*abc",
+        "*abc*",
+        "a*c",
+        "a*b*c",
+        "*a*a",
+        "aa*a",
+        "a*aa",
+        "*b*c*",
+    ],
+)
+def test_compile_glob_agrees_with_fnmatchcase(pattern: str) -> None:
+    # With '*' as the only metacharacter, glob semantics match fnmatchcase
+    texts = ["", "a", "aa", "aaa", "abc", "abcabc", "xabcx", "acb", "ab", "bc", "aXbYc", "zz"]
+    matches = compile_glob(pattern)
+    expected = [fnmatchcase(text, pattern) for text in texts]
+    assert [matches(text) for text in texts] == expected
+    assert [match_pattern(text, pattern) for text in texts] == expected
+
+
+def test_pattern_shape_counts_wildcards_and_literals() -> None:
+    assert pattern_shape("*cache*bank") == (2, 9)
+    assert pattern_shape("exact") == (0, 5)
+    assert pattern_shape("*") == (1, 0)
@@ -2,7 +2,19 @@
 
 import pytest
 
-from patternforge.engine.solver import evaluate_expr, propose_solution
+from patternforge.engine import bitset
+from patternforge.engine.models import (
+    Candidate,
+    OptimizeBudgets,
+    OptimizeWeights,
+    SolveOptions,
+)
+from patternforge.engine.solver import (
+    _Context,
+    _greedy_select,
+    evaluate_expr,
+    propose_solution,
+)
 
 
 # Default test options as kwargs
@@ -44,6 +56,76 @@ def test_propose_solution_inversion() -> None:
     assert solution.global_inverted is True
 
 
+def test_inversion_respects_fp_budget_of_returned_metrics() -> None:
+    # '-' inside pattern texts is evaluated as a difference operator, so the
+    # returned metrics, not the selection bitsets, decide the FP budget.
+    include = [
+        "cpu/mem",
+        "x-1/mem",
+        "alpha-io-ctrl",
+        "alpha-foo",
+        "io-ctrl-mem",
+        "io-ctrl",
+        "io-ctrl_beta_data-path",
+    ]
+    exclude = ["io-ctrl_foo", "bar_data-path", "mem"]
+    solution = propose_solution(
+        include, exclude, mode="APPROX", invert="always", effort="low", max_fp=2
+    )
+    assert solution.global_inverted is False
+    assert solution.metrics["fp"] == 0
+
+
+def test_high_effort_improves_on_greedy_cover() -> None:
+    # Greedy takes the widest pattern first and then needs one per leftover row;
+    # the two top-level prefixes cover everything on their own.
+    include = [
+        "left/wide/a0",
+        "left/wide/b0",
+        "rght/wide/c0",
+        "rght/wide/d0",
+        "left/e0",
+        "rght/f0",
+    ]
+    exclude = ["zzz/q0"]
+    greedy = propose_solution(include, exclude, **DEFAULT_TEST_OPTIONS)
+    assert len(greedy.patterns) == 3
+    options = dict(DEFAULT_TEST_OPTIONS, effort="high")
+    best = propose_solution(include, exclude, **options)
+    assert sorted(p.text for p in best.patterns) == ["left/*", "rght/*"]
+    assert best.metrics["covered"] == len(include)
+    assert best.metrics["fp"] == 0
+
+
+@pytest.mark.parametrize(
+    "weights,first,second",
+    [
+        # fn + len terms tie (5 - 3 - 1 == 5 - 2 - 2)
+        pytest.param(
+            OptimizeWeights(w_pattern=0.0, w_op=0.0, w_wc=0.0, w_len=-1.0),
+            ("*a*", [0, 1, 2], 1, 1),
+            ("*ab*", [0, 1], 1, 2),
+            id="less_coverage",
+        ),
+        pytest.param(
+            OptimizeWeights(w_pattern=0.0, w_op=0.0, w_wc=0.0, w_len=0.0),
+            ("abc*", [0, 1], 1, 3),
+            ("*abc*", [0, 1], 2, 3),
+            id="more_wildcards",
+        ),
+    ],
+)
+def test_greedy_select_breaks_cost_ties_in_generation_order(weights, first, second) -> None:
+    # Among equal-cost trials that add coverage, the later generated one wins
+    def cand(text: str, rows: list[int], wildcards: int, length: int) -> Candidate:
+        return Candidate(text, "substring", 1.0, bitset.make_bitset(rows), 0, wildcards, length)
+
+    options = SolveOptions(weights=weights, budgets=OptimizeBudgets(max_patterns=1))
+    ctx = _Context(include=["abc0", "abc1", "a2", "x3", "x4"], exclude=[], options=options)
+    selection = _greedy_select(ctx, [cand(*first), cand(*second)])
+    assert [c.text for c in selection.chosen] == [second[0]]
+
+
 def test_evaluate_expr_roundtrip() -> None:
     include = ["alpha/mem", "alpha/io"]
     patterns = {"P1": "*alpha*"}
@@ -74,3 +74,47 @@ def test_structured_minus_term_fields() -> None:
         nf = t.get("not_fields", {})
         if nf:
             assert isinstance(nf, dict)
+
+
+def test_pattern_stats_coverage_matches_row_scan() -> None:
+    from patternforge.engine import bitset
+    from patternforge.engine.matcher import match_pattern
+    from patternforge.engine.solver import _default_field_getter
+    from patternforge.engine.structured_scalable import PatternStats
+
+    include_rows = [{"pin": "din0"}, {"pin": "dout"}, {"pin": "din31"}]
+    exclude_rows = [{"pin": "ck"}, {"pin": "din_dbg"}]
+    for pattern in ("din*", "*out", "*in*", "ck"):
+        expected_in = bitset.make_bitset(
+            idx for idx, row in enumerate(include_rows) if match_pattern(row["pin"], pattern)
+        )
+        expected_ex = bitset.make_bitset(
+            idx for idx, row in enumerate(exclude_rows) if match_pattern(row["pin"], pattern)
+        )
+        stats = PatternStats("pin", pattern)
+        stats.compute_coverage(include_rows, exclude_rows, _default_field_getter)
+        assert (stats.include_mask, stats.exclude_mask) == (expected_in, expected_ex)
+        assert stats.coverage == bitset.count_bits(expected_in)
+
+
+def test_structured_solver_skips_fields_without_values() -> None:
+    include_rows = [{"module": "sram_a", "pin": ""}, {"module": "sram_b", "pin": ""}]
+    exclude_rows = [{"module": "dff", "pin": "ck"}]
+    sol = propose_solution_structured(include_rows, exclude_rows)
+    assert sol.metrics["covered"] == len(include_rows)
+    assert sol.metrics["fp"] == 0
+
+
+def test_pattern_stats_exact_pattern_uses_value_index() -> None:
+    from patternforge.engine.structured_scalable import PatternStats, _index_values
+
+    include_values = ["ck", "din", "ck", "dout"]
+    exclude_values = ["din", "ck"]
+    indexed = PatternStats("pin", "ck")
+    indexed.compute_coverage_bulk(
+        include_values, exclude_values, _index_values(include_values), _index_values(exclude_values)
+    )
+    scanned = PatternStats("pin", "ck")
+    scanned.compute_coverage_bulk(include_values, exclude_values)
+    assert (indexed.include_mask, indexed.exclude_mask, indexed.coverage) == (0b0101, 0b10, 2)
+    assert (scanned.include_mask, scanned.exclude_mask, scanned.coverage) == (0b0101, 0b10, 2)
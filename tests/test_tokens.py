@@ -16,3 +16,24 @@ def test_iter_tokens_sequence() -> None:
     assert it
     indexes = {idx for idx, _ in it}
     assert indexes == {0, 1}
+
+
+def test_split_classchange_ascii_and_unicode_runs() -> None:
+    assert tokens._split_classchange("ab12__CD\n3") == ["ab", "12", "__", "CD", "\n", "3"]
+    assert tokens._split_classchange("modülé_x²") == ["modülé", "_", "x", "²"]
+    assert tokens._split_classchange("") == []
+
+
+def test_tokenize_interns_repeated_values() -> None:
+    first = tokens.tokenize("chip/CACHE0", min_token_len=3)
+    second = tokens.tokenize("core_cache_ctl", min_token_len=3)
+    assert first[1].value == second[1].value == "cache"
+    assert first[1].value is second[1].value
+
+
+def test_iter_token_values_groups_rows() -> None:
+    items = ["alpha/beta", "", "x", "gamma"]
+    batched = list(tokens.iter_token_values(items, splitmethod="classchange", min_token_len=3))
+    assert batched == [(0, ["alpha", "beta"]), (3, ["gamma"])]
+    flat = [(idx, tok.value) for idx, tok in tokens.iter_tokens(items, "classchange", 3)]
+    assert flat == [(idx, value) for idx, values in batched for value in values]